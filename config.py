@@ -5,6 +5,7 @@ Centralized configuration for all pipeline components
 
 import os
 import multiprocessing as mp
+from functools import lru_cache
 from pathlib import Path
 
 
@@ -39,6 +40,10 @@ class PipelineConfig:
         "azure_upload_interval": 10,
         "max_iterations": None,  # Infinite
         "batch_timeout_seconds": 200,  # 5 minutes timeout per worker task
+        "memory_throttle_percent": 85.0,  # Pause between batches above this RAM usage
+        "pin_workers": True,  # Pin each worker process to its own core
+        "session_hash_log_capacity": 1 << 20,  # Hashes shared with workers (32 bytes each)
+        "resource_sample_seconds": 5.0,  # Reuse CPU/RAM/disk readings in batch status for this long
     }
 
     # Circuit Generation
@@ -97,6 +102,9 @@ class PipelineConfig:
     AZURE = {
         "container_name": "circuits",
         "table_name": "circuits",
+        "table_batch_size": 100,  # Entities per table transaction (Azure max: 100)
+        "upload_workers": 4,  # Concurrent blob/table uploads
+        "max_uploads_in_flight": 16,  # Pending uploads before generation waits
         "enabled": False,  # Disable Azure by default for local-only operation
     }
 
@@ -143,6 +151,19 @@ class PipelineConfig:
             "batch_timeout_seconds": self.get_env_or_default(
                 "BATCH_TIMEOUT", self.PIPELINE_DEFAULTS["batch_timeout_seconds"], int
             ),
+            "memory_throttle_percent": self.get_env_or_default(
+                "MEMORY_THROTTLE_PERCENT", self.PIPELINE_DEFAULTS["memory_throttle_percent"], float
+            ),
+            "pin_workers": self.get_env_or_default(
+                "PIN_WORKERS", self.PIPELINE_DEFAULTS["pin_workers"],
+                lambda value: str(value).lower() in ("1", "true", "yes"),
+            ),
+            "session_hash_log_capacity": self.get_env_or_default(
+                "SESSION_HASH_LOG_CAPACITY", self.PIPELINE_DEFAULTS["session_hash_log_capacity"], int
+            ),
+            "resource_sample_seconds": self.get_env_or_default(
+                "RESOURCE_SAMPLE_SECONDS", self.PIPELINE_DEFAULTS["resource_sample_seconds"], float
+            ),
         }
 
     def get_circuit_config(self):
@@ -271,6 +292,15 @@ class PipelineConfig:
             "table_name": self.get_env_or_default(
                 "AZURE_TABLE", self.AZURE["table_name"]
             ),
+            "table_batch_size": self.get_env_or_default(
+                "AZURE_TABLE_BATCH_SIZE", self.AZURE["table_batch_size"], int
+            ),
+            "upload_workers": self.get_env_or_default(
+                "AZURE_UPLOAD_WORKERS", self.AZURE["upload_workers"], int
+            ),
+            "max_uploads_in_flight": self.get_env_or_default(
+                "AZURE_MAX_UPLOADS_IN_FLIGHT", self.AZURE["max_uploads_in_flight"], int
+            ),
         }
 
     def print_config_summary(self):
@@ -320,12 +350,16 @@ class PipelineConfig:
 config = PipelineConfig()
 
 
-# Convenience functions for common use cases
+# Convenience functions for common use cases.
+# Environment variables are read once per process; the returned dicts are
+# shared between callers and must be treated as read-only.
+@lru_cache(maxsize=1)
 def get_pipeline_config():
     """Get pipeline configuration."""
     return config.get_pipeline_config()
 
 
+@lru_cache(maxsize=1)
 def get_circuit_config():
     """Get circuit generation configuration."""
     return config.get_circuit_config()
@@ -336,21 +370,36 @@ def get_synergy_rules():
     return config.get_synergy_rules()
 
 
+@lru_cache(maxsize=1)
 def get_simulation_config():
     """Get simulation configuration."""
     return config.get_simulation_config()
 
 
+@lru_cache(maxsize=1)
 def get_storage_config():
     """Get storage configuration."""
     return config.get_storage_config()
 
 
+@lru_cache(maxsize=1)
 def get_azure_config():
     """Get Azure configuration."""
     return config.get_azure_config()
 
 
+def clear_config_cache():
+    """Re-read environment variables on the next get_*_config() call."""
+    for getter in (
+        get_pipeline_config,
+        get_circuit_config,
+        get_simulation_config,
+        get_storage_config,
+        get_azure_config,
+    ):
+        getter.cache_clear()
+
+
 def apply_optimizations():
     """Apply performance optimizations."""
     config.apply_performance_optimizations()
@@ -9,25 +9,34 @@ import logging
 # Configure logging
 logger = logging.getLogger(__name__)
 
-def extract_features(circuit: QuantumCircuit):
+def extract_features(circuit: QuantumCircuit, precomputed: dict = None):
     """
     Extracts static and graph features from a given quantum circuit.
     
     Args:
         circuit (QuantumCircuit): The quantum circuit to analyze.
+        precomputed (dict, optional): Values the caller already knows, such as
+            {"num_qubits": n, "depth": d, "size": s}. They seed the shared
+            feature cache so the extractors do not walk the circuit again.
     
     Returns:
         dict: A dictionary containing extracted features.
     """
-    logger.info(f"Starting feature extraction for circuit: {circuit.num_qubits} qubits, depth {circuit.depth()}")
-    
     if not isinstance(circuit, QuantumCircuit):
         raise ValueError("Input must be a QuantumCircuit instance.")
     
+    # depth() walks every instruction; compute it at most once per extraction
+    known = dict(precomputed) if precomputed else {}
+    known.setdefault("num_qubits", circuit.num_qubits)
+    if "depth" not in known:
+        known["depth"] = circuit.depth()
+    logger.info("Starting feature extraction for circuit: %d qubits, depth %d", known["num_qubits"], known["depth"])
+    
     try:
         # Initialize feature extractors
         logger.debug("Initializing feature extractors...")
         feature_extractor = FeatureExtracter(circuit=circuit)
+        feature_extractor.extracted_features.update(known)
         # graph_feature_extractor = GraphFeatureExtracter(circuit=circuit, feature_extractor=feature_extractor)
         graph_feature_extractor = IGGraphExtractor(circuit=circuit, feature_extractor=feature_extractor)
         static_feature_extractor = StaticFeatureExtractor(circuit=circuit, feature_extractor=feature_extractor)
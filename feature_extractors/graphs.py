@@ -145,7 +145,10 @@ class IGGraphExtractor():
         """
         if "igdepth" in self.extracted_features:
             return {"igdepth": self.extracted_features["igdepth"]}
-        value = self.circuit.depth() if self.circuit else 0
+        if "depth" in self.extracted_features:
+            value = self.extracted_features["depth"]
+        else:
+            value = self.circuit.depth() if self.circuit else 0
         self.extracted_features["igdepth"] = value
         return {"igdepth": value}
 
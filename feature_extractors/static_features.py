@@ -174,7 +174,7 @@ class StaticFeatureExtractor():
             self.extracted_features["idling_score"] = 0.0
             return {"idling_score": 0.0}
         num_qubits = self.extracted_features["num_qubits"]
-        depth = self.circuit.depth()
+        depth = self.getQiskitCircuitDepth()["depth"]
         if depth == 0 or num_qubits <= 1:
             self.extracted_features["idling_score"] = 0.0
             return {"idling_score": 0.0}
@@ -76,6 +76,24 @@ class CircuitMerger:
         np.random.seed(base_params.seed)
         logger.info(f"CircuitMerger initialized with {len(self.generators)} generators")
 
+    def reseed(self, seed: int) -> None:
+        """
+        Re-seed the merger for a new circuit without rebuilding the generators.
+
+        All generators share ``self.base_params``, so updating its seed and the
+        global RNGs is enough for the parameter helpers; generators that keep
+        their own RNG get a fresh one.
+
+        Args:
+            seed: New random seed, as would be passed in BaseParams
+        """
+        self.base_params.seed = seed
+        random.seed(seed)
+        np.random.seed(seed)
+        for generator in self.generators:
+            if hasattr(generator, "rng"):
+                generator.rng = random.Random(seed)
+
     def initialize_generators(self) -> List[Generator]:
         """
         Initialize all generator classes with the base parameters.
@@ -215,7 +233,8 @@ class CircuitMerger:
             return QuantumCircuit()
 
         logger.info(f"Selected {len(selected_generators)} generators for hierarchical circuit")
-        logger.debug(f"Selected generators: {[gen.__class__.__name__ for gen in selected_generators]}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Selected generators: %s", [gen.__class__.__name__ for gen in selected_generators])
 
         # Generate circuits from selected generators only
         logger.debug("Generating individual circuits from selected generators...")
@@ -240,7 +259,9 @@ class CircuitMerger:
                 if circuit is not None and hasattr(circuit, "data"):
                     circuit.name = generator_name
                     successful_circuits.append(circuit)
-                    logger.debug(f"✓ Generated {circuit.name}: {circuit.num_qubits}q, depth={circuit.depth()}")
+                    # depth() walks the circuit; only pay for it when debugging
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug("✓ Generated %s: %dq, depth=%d", circuit.name, circuit.num_qubits, circuit.depth())
                 else:
                     logger.warning(f"✗ {generator_name} returned None or invalid circuit")
 
@@ -301,7 +322,11 @@ class CircuitMerger:
             logger.debug(f"Circuit has {len(merged_circuit.parameters)} parameters, assigning random values...")
             merged_circuit = self._assign_circuit_parameters(merged_circuit)
         
-        logger.info(f"✓ Circuit generation completed: {merged_circuit.num_qubits} qubits, depth {merged_circuit.depth()}, size {merged_circuit.size()}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "✓ Circuit generation completed: %d qubits, depth %d, size %d",
+                merged_circuit.num_qubits, merged_circuit.depth(), merged_circuit.size()
+            )
         return merged_circuit
 
     def _make_parameters_unique(self, circuit: QuantumCircuit, circuit_index: int) -> QuantumCircuit:
@@ -520,6 +545,9 @@ class CircuitMerger:
             current_probs: Current probability distribution (NumPy array)
             step: Current step in the generation process
         """
+        # Skip the masking and formatting entirely when nobody will see it
+        if not logger.isEnabledFor(logging.DEBUG):
+            return
         logger.debug(f"\n--- Probability Distribution at Step {step} ---")
         # Use NumPy boolean indexing for efficient filtering
         significant_mask = current_probs > 0.01
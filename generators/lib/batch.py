@@ -0,0 +1,55 @@
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+from qiskit import QuantumCircuit
+
+from generators.lib.generator import Generator, BaseParams
+
+
+def _generate_one(job: tuple[type[Generator], BaseParams]) -> QuantumCircuit:
+    """
+    Build a single circuit inside a worker process.
+
+    The parameter helpers draw from the global ``random``/``numpy`` state, so
+    it is reseeded from ``base_params.seed`` first; a seeded job then produces
+    the same circuit no matter which worker runs it.
+    """
+    gen_cls, base_params = job
+    if base_params.seed is not None:
+        random.seed(base_params.seed)
+        np.random.seed(base_params.seed)
+
+    generator = gen_cls(base_params)
+    params = generator.generate_parameters()
+    if isinstance(params, tuple):
+        return generator.generate(*params)
+    elif isinstance(params, dict):
+        return generator.generate(**params)
+    return generator.generate(params)
+
+
+def generate_batch(
+    gen_cls: type[Generator],
+    params_list: list[BaseParams],
+    max_workers: int = None,
+) -> list[QuantumCircuit]:
+    """
+    Generate one circuit per BaseParams entry, fanned out across processes.
+
+    :param gen_cls: Generator class to instantiate for every entry.
+    :param params_list: Parameter grid; one circuit is produced per item.
+    :param max_workers: Number of worker processes (default: CPU count).
+    :return: Generated circuits, in the same order as ``params_list``.
+    """
+    if not params_list:
+        return []
+
+    workers = max_workers or os.cpu_count() or 1
+    # Larger chunks amortize pickling of the small BaseParams payloads
+    chunksize = max(1, len(params_list) // (4 * workers))
+    jobs = [(gen_cls, base_params) for base_params in params_list]
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(_generate_one, jobs, chunksize=chunksize))
@@ -0,0 +1,67 @@
+from functools import lru_cache
+
+from qiskit import ClassicalRegister, QuantumCircuit, QuantumRegister
+
+
+@lru_cache(maxsize=128)
+def cx_ladder(num_qubits: int, reverse: bool = False) -> QuantumCircuit:
+    """
+    Build a linear chain of CX gates between neighbouring qubits.
+
+    The result is cached and shared between callers, so it must only be
+    composed into other circuits (``qc.compose(cx_ladder(n), inplace=True)``)
+    and never mutated directly.
+
+    :param num_qubits: Number of qubits spanned by the ladder.
+    :param reverse: If False, apply cx(0, 1), cx(1, 2), ...; if True, apply
+                    the same gates from the last pair back to the first.
+    :return: A QuantumCircuit containing only the CX ladder.
+    """
+    qc = QuantumCircuit(num_qubits, name=f"cx_ladder({num_qubits})")
+    pairs = range(num_qubits - 1)
+    for i in reversed(pairs) if reverse else pairs:
+        qc.cx(i, i + 1)
+    return qc
+
+
+@lru_cache(maxsize=128)
+def empty_circuit(num_qubits: int) -> QuantumCircuit:
+    """
+    Return a cached empty circuit over a single ``q`` register of the given size.
+
+    Use ``empty_circuit(n).copy_empty_like(name=...)`` to get a fresh circuit
+    without re-creating the register on every call.
+
+    :param num_qubits: Number of qubits in the register.
+    :return: A shared, empty QuantumCircuit that must not be mutated.
+    """
+    return QuantumCircuit(QuantumRegister(num_qubits, "q"))
+
+
+@lru_cache(maxsize=128)
+def measure_tail(num_qubits: int) -> QuantumCircuit:
+    """
+    Build the barrier + measure-every-qubit block that ``measure_all`` appends.
+
+    Cached and shared between callers; apply it with :func:`add_measure_tail`.
+
+    :param num_qubits: Number of qubits to measure.
+    :return: A QuantumCircuit with a ``meas`` classical register of the same size.
+    """
+    qc = QuantumCircuit(
+        QuantumRegister(num_qubits, "q"), ClassicalRegister(num_qubits, "meas")
+    )
+    qc.barrier()
+    qc.measure(range(num_qubits), range(num_qubits))
+    return qc
+
+
+def add_measure_tail(qc: QuantumCircuit) -> None:
+    """
+    In-place equivalent of ``qc.measure_all()`` for circuits without classical bits.
+
+    :param qc: Circuit to measure; gains the cached ``meas`` register.
+    """
+    tail = measure_tail(qc.num_qubits)
+    qc.add_register(*tail.cregs)
+    qc.compose(tail, inplace=True)
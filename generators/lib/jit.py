@@ -0,0 +1,25 @@
+"""
+Optional Numba JIT support for the small numeric kernels used by generators.
+
+Numba is not a hard dependency: when it is missing, ``njit`` becomes a no-op
+decorator and ``prange`` falls back to ``range``, so decorated functions run
+as plain Python/NumPy with identical results.
+"""
+
+try:
+    from numba import njit, prange
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit, usable bare or with options."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def decorator(func):
+            return func
+
+        return decorator
@@ -1,5 +1,5 @@
 import random
-import networkx as nx
+import numpy as np
 
 
 def num_qbits(min_qubits: int, max_qubits: int, seed: int = None) -> int:
@@ -29,7 +29,7 @@ def depth(min_depth: int, max_depth: int, seed: int = None) -> int:
 
 def adjacency_graph(
     num_qubits: int, seed: int = None, p: float = 0.5, return_edges: bool = False
-) -> list[list[int]]:
+) -> np.ndarray | list[list[int]]:
     """
     Generate a random graph using NetworkX's G(n, p) model,
     returning either an adjacency matrix or adjacency list.
@@ -38,18 +38,19 @@ def adjacency_graph(
     :param seed: Random seed for reproducibility.
     :param p: Edge‐presence probability (default 0.5).
     :param adjacency_list: If True, return adjacency list; else adjacency matrix.
-    :return: Either a nested list-of-lists adjacency matrix (0/1)
-             or adjacency list ([[neighbors_of_0], [neighbors_of_1], …]).
+    :return: Either a dense ``num_qubits x num_qubits`` boolean adjacency matrix
+             or an edge list ([[u, v], …]) when return_edges is True.
     """
+    import networkx as nx
+
     G = nx.gnp_random_graph(num_qubits, p, seed=seed, directed=False)
 
     if return_edges:
         # Return each undirected edge once as [u, v]
         return [[u, v] for u, v in G.edges()]
     else:
-        # Convert to dense adjacency matrix
-        A = nx.to_numpy_array(G, dtype=int)
-        return A.astype(int).tolist()
+        # Convert to dense boolean adjacency matrix
+        return nx.to_numpy_array(G, dtype=bool)
 
 
 def reps(min_reps: int, max_reps: int, seed: int = None) -> int:
@@ -106,18 +107,21 @@ def random_parameter_values(
     seed: int = None,
     min_val: float = 0.0,
     max_val: float = 2 * 3.14159,
-) -> list[float]:
+) -> np.ndarray:
     """
-    Generate a list of random parameter values for quantum circuits.
+    Generate random parameter values for quantum circuits in one bulk draw.
+
+    Values come from NumPy's global generator (seeded by CircuitMerger), so
+    successive calls keep producing fresh values under a fixed seed.
 
     :param num_params: Number of parameters needed.
     :param seed: Random seed for reproducibility.
     :param min_val: Minimum value for parameters (default: 0.0).
     :param max_val: Maximum value for parameters (default: 2π).
-    :return: List of random parameter values.
+    :return: Contiguous float64 array of random parameter values.
     """
-  
-    return [round(random.uniform(min_val, max_val),3) for _ in range(num_params)]
+
+    return np.round(np.random.uniform(min_val, max_val, size=num_params), 3)
 
 
 def evaluation_qubits(min_eval: int = 2, max_eval: int = 6, seed: int = None) -> int:
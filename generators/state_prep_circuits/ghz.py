@@ -1,6 +1,7 @@
 from qiskit import QuantumCircuit
 from generators.lib.generator import Generator, BaseParams
 from generators.lib.parameters import num_qbits
+from generators.lib.blocks import add_measure_tail, cx_ladder, empty_circuit
 
 
 class GHZ(Generator):
@@ -17,13 +18,12 @@ class GHZ(Generator):
         Create an n-qubit GHZ state:
         |GHZ⟩ = (|0…0> + |1…1>)/√2
         """
-        qc = QuantumCircuit(num_qubits, name=f"GHZ({num_qubits})")
+        qc = empty_circuit(num_qubits).copy_empty_like(name=f"GHZ({num_qubits})")
         qc.h(0)
-        for i in range(num_qubits - 1):
-            qc.cx(i, i + 1)
+        qc.compose(cx_ladder(num_qubits), inplace=True)
 
         if self.measure:
-            qc.measure_all()
+            add_measure_tail(qc)
 
         return qc
 
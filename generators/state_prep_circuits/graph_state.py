@@ -1,6 +1,44 @@
+import numpy as np
 from qiskit import QuantumCircuit
 from generators.lib.generator import Generator, BaseParams
 from generators.lib.parameters import num_qbits, adjacency_graph
+from generators.lib.blocks import add_measure_tail, empty_circuit
+from generators.lib.jit import NUMBA_AVAILABLE, njit, prange
+
+
+@njit(parallel=True, cache=True)
+def _graph_state_edges(adj_flat_u8: np.ndarray, n: int) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Extract the upper-triangle edges of a dense, row-major flattened adjacency.
+
+    Rows are scanned in parallel twice: once to count edges per row, then to
+    fill them at precomputed offsets, so edges stay in row-major order.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: (row, col) int64 arrays, one entry per edge
+    """
+    counts = np.zeros(n, dtype=np.int64)
+    for i in prange(n):
+        c = 0
+        for j in range(i + 1, n):
+            if adj_flat_u8[i * n + j]:
+                c += 1
+        counts[i] = c
+
+    offsets = np.zeros(n + 1, dtype=np.int64)
+    for i in range(n):
+        offsets[i + 1] = offsets[i] + counts[i]
+
+    rows = np.empty(offsets[n], dtype=np.int64)
+    cols = np.empty(offsets[n], dtype=np.int64)
+    for i in prange(n):
+        k = offsets[i]
+        for j in range(i + 1, n):
+            if adj_flat_u8[i * n + j]:
+                rows[k] = i
+                cols[k] = j
+                k += 1
+    return rows, cols
 
 
 class GraphState(Generator):
@@ -11,21 +49,45 @@ class GraphState(Generator):
     def __init__(self, base_params: BaseParams):
         super().__init__(base_params)
 
-    def generate(self, adjacency: list[list[int]]) -> QuantumCircuit:
-        """Graph state from adjacency matrix."""
-        n = len(adjacency)
-        qc = QuantumCircuit(n, name="GraphState")
-        for i in range(n):
-            qc.h(i)
-        for i in range(n):
-            for j in range(i + 1, n):
-                if adjacency[i][j]:
-                    qc.cz(i, j)
+    def generate(
+        self, adjacency: "np.ndarray | scipy.sparse.coo_matrix | list[list[int]]"
+    ) -> QuantumCircuit:
+        """
+        Graph state from adjacency matrix.
+
+        The adjacency may be a SciPy sparse matrix, a dense ndarray, or a
+        list-of-lists (wrapped with np.asarray). Sparse input only visits its
+        stored upper-triangle entries (O(E)); dense input is scanned by the
+        compiled _graph_state_edges kernel, or by a single np.triu_indices
+        mask when Numba is unavailable.
+        """
+        if hasattr(adjacency, "tocoo"):
+            # Only sparse inputs need SciPy, so import it on demand
+            import scipy.sparse as sp
+
+            n = adjacency.shape[0]
+            # Round-trip through CSR so edges come out in row-major order
+            edges = sp.triu(adjacency, k=1).tocsr().tocoo()
+            rows, cols = edges.row, edges.col
+        else:
+            dense = np.asarray(adjacency, dtype=np.uint8)
+            n = dense.shape[0] if dense.ndim == 2 else 0
+            if NUMBA_AVAILABLE:
+                rows, cols = _graph_state_edges(dense.reshape(-1), n)
+            else:
+                iu, ju = np.triu_indices(n, k=1)
+                mask = dense[iu, ju].astype(bool)
+                rows, cols = iu[mask], ju[mask]
+
+        qc = empty_circuit(n).copy_empty_like(name="GraphState")
+        qc.h(range(n))
+        for i, j in zip(rows.tolist(), cols.tolist()):
+            qc.cz(i, j)
         if self.measure:
-            qc.measure_all()
+            add_measure_tail(qc)
         return qc
 
-    def generate_parameters(self) -> list[list[int]]:
+    def generate_parameters(self) -> np.ndarray:
         self.measure = self.base_params.measure
         self.num_qubits = num_qbits(
             self.base_params.min_qubits,
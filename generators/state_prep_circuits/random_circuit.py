@@ -1,9 +1,23 @@
+import os
+from functools import lru_cache
+
 from qiskit.circuit.random import random_circuit
 from qiskit import QuantumCircuit
 
 from generators.lib.generator import Generator, BaseParams
 from generators.lib.parameters import num_qbits, depth
 
+# Number of distinct (width, depth, measure, seed) templates kept in memory
+RANDOM_CIRCUIT_CACHE_SIZE = int(os.getenv("RANDOM_CIRCUIT_CACHE_SIZE", "256"))
+
+
+@lru_cache(maxsize=RANDOM_CIRCUIT_CACHE_SIZE)
+def _random_circuit_cached(
+    width: int, depth_x2: int, measure: bool, seed: int
+) -> QuantumCircuit:
+    """Build a seeded random circuit template; callers must copy before mutating."""
+    return random_circuit(width, depth_x2, measure=measure, seed=seed)
+
 
 class RandomCircuit(Generator):
     """
@@ -15,8 +29,17 @@ class RandomCircuit(Generator):
         self.measure = self.base_params.measure
 
     def generate(self, width: int, depth: int) -> QuantumCircuit:
-        """Generate a random quantum circuit."""
-        qc = random_circuit(width, depth * 2, measure=self.measure, seed=10)
+        """
+        Generate a random quantum circuit.
+
+        Seeded circuits are deterministic, so they are served from a template
+        cache and copied; unseeded circuits are always built fresh.
+        """
+        seed = self.base_params.seed
+        if seed is None:
+            qc = random_circuit(width, depth * 2, measure=self.measure)
+        else:
+            qc = _random_circuit_cached(width, depth * 2, self.measure, seed).copy()
         qc.name = f"RandomCircuit{width}x{depth}"
         return qc
 
@@ -35,6 +58,28 @@ class RandomCircuit(Generator):
         return self.num_qubits, self.depth
 
 
+# Backward compatible function
+def generate(width, depth):
+    """
+    Backward-compatible function to generate a random circuit.
+
+    Args:
+        width (int): Number of qubits
+        depth (int): Depth parameter; the circuit is built with 2 * depth layers
+
+    Returns:
+        QuantumCircuit: The generated random circuit
+    """
+    params = BaseParams(
+        max_qubits=width,
+        min_qubits=width,
+        max_depth=depth,
+        min_depth=depth,
+        measure=False,
+    )
+    return RandomCircuit(params).generate(width, depth)
+
+
 if __name__ == "__main__":
     # Example usage
     params = BaseParams(
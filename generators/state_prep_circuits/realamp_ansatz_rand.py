@@ -1,10 +1,23 @@
 from qiskit.circuit.library import RealAmplitudes as QiskitRealAmplitudes
 from qiskit.circuit import QuantumCircuit
 from generators.lib.generator import Generator, BaseParams
+from generators.lib.blocks import add_measure_tail
 from generators.lib.parameters import num_qbits, depth, random_parameter_values
-from utils.circuit_hash import compute_circuit_hash_simple
+from functools import lru_cache
 import random
 import numpy as np
+
+
+@lru_cache(maxsize=128)
+def _real_amplitudes_template(num_qubits: int, reps: int) -> QuantumCircuit:
+    """
+    Build the decomposed, still-parameterized RealAmplitudes circuit once per shape.
+
+    Shared between callers: copy it before binding parameters.
+    """
+    return QiskitRealAmplitudes(num_qubits=num_qubits, reps=reps).decompose()
+
+
 class RealAmplitudes(Generator):
     """
     Class to generate a RealAmplitudes ansatz circuit with random parameters.
@@ -15,7 +28,10 @@ class RealAmplitudes(Generator):
         self.measure = self.base_params.measure
 
     def generate(
-        self, num_qubits: int, circuit_depth: int, parameter_values: list[float]
+        self,
+        num_qubits: int,
+        circuit_depth: int,
+        parameter_values: np.ndarray | list[float],
     ) -> QuantumCircuit:
         """
         Creates and completes a RealAmplitudes Qiskit circuit with the provided parameters.
@@ -27,37 +43,43 @@ class RealAmplitudes(Generator):
         Args:
             num_qubits (int): The number of qubits in the circuit.
             circuit_depth (int): The number of layers (repetitions) of the ansatz.
-            parameter_values (list[float]): A list of numerical values to bind to the
-                                            circuit's parameters. The length of this list
+            parameter_values (np.ndarray | list[float]): The numerical values to bind to the
+                                            circuit's parameters. Their count
                                             must match the number of parameters expected
                                             by the RealAmplitudes circuit.
 
         Returns:
             QuantumCircuit: A Qiskit QuantumCircuit with all its parameters bound to
-                            the provided numerical values. Returns None if parameter
-                            count does not match.
+                            the provided numerical values.
+
+        Raises:
+            ValueError: If the number of parameter values does not match the
+                        number of parameters expected by the ansatz.
         """
-        # Create the base parameterized RealAmplitudes circuit using Qiskit API
-        ansatz_circuit = QiskitRealAmplitudes(num_qubits=num_qubits, reps=circuit_depth)
+        # Reuse the cached decomposed template for this shape
+        template = _real_amplitudes_template(num_qubits, circuit_depth)
 
         # Check if the provided parameter_values match the number of expected parameters
-        expected_params = len(ansatz_circuit.parameters)
+        expected_params = template.num_parameters
         if len(parameter_values) != expected_params:
-            print(
-                f"Error: Mismatch in parameter count. Expected {expected_params} parameters, "
-                f"but got {len(parameter_values)} values."
+            raise ValueError(
+                f"Expected {expected_params} parameters, got {len(parameter_values)}"
+            )
+        # Bind positionally on an owned copy; a float ndarray takes Qiskit's fast path.
+        # Parameter-free configurations skip binding entirely.
+        ansatz_circuit = template.copy()
+        if expected_params:
+            ansatz_circuit.assign_parameters(
+                np.ascontiguousarray(parameter_values, dtype=float), inplace=True
             )
-            return None
-        # Assign the numerical values to the parameters
-        ansatz_circuit.assign_parameters(parameter_values,inplace=True)
         ansatz_circuit.name = f"RealAmplitudes({num_qubits}q,{circuit_depth}d)"
 
         if self.measure:
-            ansatz_circuit.measure_all()
+            add_measure_tail(ansatz_circuit)
 
-        return ansatz_circuit.decompose()
+        return ansatz_circuit
 
-    def generate_parameters(self) -> tuple[int, int, list[float]]:
+    def generate_parameters(self) -> tuple[int, int, np.ndarray]:
         """
         Generate parameters for the RealAmplitudes circuit.
 
@@ -110,8 +132,12 @@ if __name__ == "__main__":
         else f"  - Parameter values: {parameter_values}"
     )
 
-    real_amplitudes_circuit = real_amplitudes_generator.generate(
-        num_qubits, circuit_depth, parameter_values
-    )
-    print("\nGenerated circuit:")
-    print(real_amplitudes_circuit)
+    try:
+        real_amplitudes_circuit = real_amplitudes_generator.generate(
+            num_qubits, circuit_depth, parameter_values
+        )
+    except ValueError as e:
+        print(f"Error: {e}")
+    else:
+        print("\nGenerated circuit:")
+        print(real_amplitudes_circuit)
@@ -2,8 +2,69 @@
 from qiskit.circuit.library import TwoLocal as QiskitTwoLocal
 from qiskit.circuit import QuantumCircuit
 from generators.lib.generator import Generator, BaseParams
+from generators.lib.blocks import add_measure_tail
 from generators.lib.parameters import num_qbits, reps, random_parameter_values
+from functools import lru_cache
 import random
+import numpy as np
+
+# Entanglement gates without free parameters. The closed-form count in
+# _count_two_local_params is only valid when every entanglement block is one
+# of these; anything else (e.g. 'crx', 'crz') falls back to building the ansatz.
+_PARAMETER_FREE_ENTANGLERS = {"cx", "cz", "cy"}
+
+
+def _count_two_local_params(
+    num_qubits: int,
+    reps: int,
+    rotation_blocks: list[str],
+    skip_final_rotation_layer: bool,
+) -> int:
+    """
+    Compute the number of parameters of a TwoLocal ansatz without building it.
+
+    Only the single-qubit rotation blocks carry parameters: each of the
+    ``reps`` rotation layers (plus the final one unless skipped) applies every
+    rotation block to every qubit.
+
+    Args:
+        num_qubits (int): The number of qubits in the circuit.
+        reps (int): The number of repetitions (layers) of the ansatz.
+        rotation_blocks (list[str]): Gate names used for the rotation layers.
+        skip_final_rotation_layer (bool): Whether the last rotation layer is omitted.
+
+    Returns:
+        int: The number of free parameters of the ansatz.
+    """
+    rotation_layers = reps + (0 if skip_final_rotation_layer else 1)
+    return num_qubits * len(rotation_blocks) * rotation_layers
+
+
+@lru_cache(maxsize=256)
+def _two_local_template(
+    num_qubits: int,
+    reps: int,
+    rotation_blocks: tuple[str, ...],
+    entanglement_blocks: tuple[str, ...],
+    entanglement: str | tuple[tuple[int, ...], ...],
+    skip_final_rotation_layer: bool,
+) -> QuantumCircuit:
+    """
+    Build the decomposed, still-parameterized TwoLocal circuit once per configuration.
+
+    Shared between callers: copy it before binding parameters. An explicit
+    entanglement map is passed as a tuple of tuples so it can be a cache key.
+    """
+    if not isinstance(entanglement, str):
+        entanglement = [list(pair) for pair in entanglement]
+    return QiskitTwoLocal(
+        num_qubits=num_qubits,
+        reps=reps,
+        rotation_blocks=list(rotation_blocks),
+        entanglement_blocks=list(entanglement_blocks),
+        entanglement=entanglement,
+        skip_final_rotation_layer=skip_final_rotation_layer,
+    ).decompose()
 
 
 class TwoLocal(Generator):
@@ -14,12 +75,14 @@ class TwoLocal(Generator):
     def __init__(self, base_params: BaseParams):
         super().__init__(base_params)
         self.measure = self.base_params.measure
+        # Per-instance RNG so concurrent generators never share global random state
+        self.rng = random.Random(self.base_params.seed)
 
     def generate(
         self,
         num_qubits: int,
         circuit_reps: int,
-        parameter_values: list[float],
+        parameter_values: np.ndarray | list[float],
         rotation_blocks: list[str] = None,
         entanglement_blocks: list[str] = None,
         entanglement: str = "full",
@@ -35,8 +98,8 @@ class TwoLocal(Generator):
         Args:
             num_qubits (int): The number of qubits in the circuit.
             circuit_reps (int): The number of repetitions (layers) of the ansatz.
-            parameter_values (list[float]): A list of numerical values to bind to the
-                                            circuit's parameters. The length of this list
+            parameter_values (np.ndarray | list[float]): The numerical values to bind to the
+                                            circuit's parameters. Their count
                                             must match the number of parameters expected
                                             by the TwoLocal circuit.
             rotation_blocks (list[str], optional): A list of gate names (e.g., ['ry', 'rz'])
@@ -53,45 +116,54 @@ class TwoLocal(Generator):
 
         Returns:
             QuantumCircuit: A Qiskit QuantumCircuit with all its parameters bound to
-                            the provided numerical values. Returns None if parameter
-                            count does not match.
+                            the provided numerical values.
+
+        Raises:
+            ValueError: If the number of parameter values does not match the
+                        number of parameters expected by the ansatz.
         """
         if rotation_blocks is None:
             rotation_blocks = ["ry", "rz"]
         if entanglement_blocks is None:
             entanglement_blocks = ["cx"]
 
-        # Create the TwoLocal ansatz circuit
-        ansatz = QiskitTwoLocal(
-            num_qubits=num_qubits,
-            reps=circuit_reps,
-            rotation_blocks=rotation_blocks,
-            entanglement_blocks=entanglement_blocks,
-            entanglement=entanglement,
-            skip_final_rotation_layer=skip_final_rotation_layer,
+        # Reuse the cached decomposed template for this configuration; a list
+        # of qubit pairs becomes a tuple of tuples so it is hashable
+        if not isinstance(entanglement, str):
+            entanglement = tuple(tuple(pair) for pair in entanglement)
+        template = _two_local_template(
+            num_qubits,
+            circuit_reps,
+            tuple(rotation_blocks),
+            tuple(entanglement_blocks),
+            entanglement,
+            skip_final_rotation_layer,
         )
 
         # Check if the provided parameter_values match the number of expected parameters
-        expected_params = len(ansatz.parameters)
+        expected_params = template.num_parameters
         if len(parameter_values) != expected_params:
-            print(
-                f"Error: Mismatch in parameter count. Expected {expected_params} parameters, "
-                f"but got {len(parameter_values)} values."
+            raise ValueError(
+                f"Expected {expected_params} parameters, got {len(parameter_values)}"
             )
-            return None
 
-        # Assign the numerical values to the parameters
-        completed_circuit = ansatz.assign_parameters(parameter_values)
+        # Bind positionally on an owned copy; a float ndarray takes Qiskit's fast path.
+        # Parameter-free configurations skip binding entirely.
+        completed_circuit = template.copy()
+        if expected_params:
+            completed_circuit.assign_parameters(
+                np.ascontiguousarray(parameter_values, dtype=float), inplace=True
+            )
         completed_circuit.name = f"TwoLocal({num_qubits}q,{circuit_reps}r)"
 
         if self.measure:
-            completed_circuit.measure_all()
+            add_measure_tail(completed_circuit)
 
-        return completed_circuit.decompose()
+        return completed_circuit
 
     def generate_parameters(
         self,
-    ) -> tuple[int, int, list[float], list[str], list[str], str, bool]:
+    ) -> tuple[int, int, np.ndarray, list[str], list[str], str, bool]:
         """
         Generate parameters for the TwoLocal circuit.
 
@@ -123,24 +195,32 @@ class TwoLocal(Generator):
         entanglement_options = [["cx"], ["cz"], ["cy"]]
         entanglement_patterns = ["full", "linear", "circular"]
 
-        # Use current random state set by CircuitMerger instead of resetting seed
-        # This ensures reproducibility while maintaining proper random sequence
-        self.rotation_blocks = random.choice(rotation_options)
-        self.entanglement_blocks = random.choice(entanglement_options)
-        self.entanglement = random.choice(entanglement_patterns)
-        self.skip_final_rotation_layer = random.choice([True, False])
-
-        # Create a temporary circuit to count parameters
-        temp_ansatz = QiskitTwoLocal(
-            num_qubits=self.num_qubits,
-            reps=self.circuit_reps,
-            rotation_blocks=self.rotation_blocks,
-            entanglement_blocks=self.entanglement_blocks,
-            entanglement=self.entanglement,
-            skip_final_rotation_layer=self.skip_final_rotation_layer,
-        )
+        # Draw from the instance RNG instead of the global random module so
+        # generation stays reproducible and safe to run from parallel workers
+        self.rotation_blocks = self.rng.choice(rotation_options)
+        self.entanglement_blocks = self.rng.choice(entanglement_options)
+        self.entanglement = self.rng.choice(entanglement_patterns)
+        self.skip_final_rotation_layer = self.rng.choice([True, False])
 
-        num_params = len(temp_ansatz.parameters)
+        # Count parameters analytically; only build a probe ansatz when an
+        # entanglement block could carry parameters of its own
+        if set(self.entanglement_blocks) <= _PARAMETER_FREE_ENTANGLERS:
+            num_params = _count_two_local_params(
+                self.num_qubits,
+                self.circuit_reps,
+                self.rotation_blocks,
+                self.skip_final_rotation_layer,
+            )
+        else:
+            temp_ansatz = QiskitTwoLocal(
+                num_qubits=self.num_qubits,
+                reps=self.circuit_reps,
+                rotation_blocks=self.rotation_blocks,
+                entanglement_blocks=self.entanglement_blocks,
+                entanglement=self.entanglement,
+                skip_final_rotation_layer=self.skip_final_rotation_layer,
+            )
+            num_params = len(temp_ansatz.parameters)
         self.parameter_values = random_parameter_values(
             num_params, seed=self.base_params.seed
         )
@@ -196,14 +276,18 @@ if __name__ == "__main__":
         else f"  - Parameter values: {parameter_values}"
     )
 
-    two_local_circuit = two_local_generator.generate(
-        num_qubits,
-        circuit_reps,
-        parameter_values,
-        rotation_blocks,
-        entanglement_blocks,
-        entanglement,
-        skip_final,
-    )
-    print("\nGenerated circuit:")
-    print(two_local_circuit)
+    try:
+        two_local_circuit = two_local_generator.generate(
+            num_qubits,
+            circuit_reps,
+            parameter_values,
+            rotation_blocks,
+            entanglement_blocks,
+            entanglement,
+            skip_final,
+        )
+    except ValueError as e:
+        print(f"Error: {e}")
+    else:
+        print("\nGenerated circuit:")
+        print(two_local_circuit)
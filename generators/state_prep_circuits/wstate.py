@@ -1,9 +1,54 @@
 from qiskit import QuantumCircuit, QuantumRegister
 from generators.lib.generator import Generator, BaseParams
 from generators.lib.parameters import num_qbits
+from generators.lib.blocks import add_measure_tail, cx_ladder, empty_circuit
+from generators.lib.jit import njit
+from functools import lru_cache
 import numpy as np
 
 
+@njit(cache=True)
+def _wstate_thetas(n: int) -> np.ndarray:
+    """
+    Rotation angles of the n-1 f-gates used to build an n-qubit W state.
+
+    Args:
+        n (int): Number of qubits for the W state
+
+    Returns:
+        np.ndarray: Angle of the m-th f-gate at index m-1
+    """
+    ks = np.arange(1, n)
+    return np.arccos(np.sqrt(1.0 / (n - ks + 1)))
+
+
+@lru_cache(maxsize=128)
+def _wstate_f_chain(num_qubits: int) -> QuantumCircuit:
+    """
+    Build the X + f-gate chain that spreads a single excitation over n qubits.
+
+    Cached and shared between callers; compose it, never mutate it.
+    """
+    q = QuantumRegister(num_qubits, "q")
+    qc = QuantumCircuit(q)
+
+    # Precompute all f_gate rotation angles in a single compiled call
+    thetas = _wstate_thetas(num_qubits)
+
+    # W state construction using MQT bench approach
+    qc.x(q[-1])
+
+    for m in range(1, num_qubits):
+        theta = thetas[m - 1]
+        control = q[num_qubits - m]
+        target = q[num_qubits - m - 1]
+        qc.ry(-theta, target)
+        qc.cz(control, target)
+        qc.ry(theta, target)
+
+    return qc
+
+
 class WState(Generator):
     """
     Class to generate a W-state quantum circuit.
@@ -24,29 +69,14 @@ class WState(Generator):
         Returns:
             QuantumCircuit: The generated W state circuit
         """
-        q = QuantumRegister(num_qubits, "q")
-        qc = QuantumCircuit(q, name=f"WState({num_qubits})")
-
-        # Helper function for the f_gate used in W state construction
-        def f_gate(
-            qc: QuantumCircuit, q: QuantumRegister, i: int, j: int, n: int, k: int
-        ) -> None:
-            theta = np.arccos(np.sqrt(1 / (n - k + 1)))
-            qc.ry(-theta, q[j])
-            qc.cz(q[i], q[j])
-            qc.ry(theta, q[j])
-
-        # W state construction using MQT bench approach
-        qc.x(q[-1])
-
-        for m in range(1, num_qubits):
-            f_gate(qc, q, num_qubits - m, num_qubits - m - 1, num_qubits, m)
+        qc = empty_circuit(num_qubits).copy_empty_like(name=f"WState({num_qubits})")
 
-        for k in reversed(range(1, num_qubits)):
-            qc.cx(k - 1, k)
+        # Both blocks depend only on num_qubits, so they are built once and reused
+        qc.compose(_wstate_f_chain(num_qubits), inplace=True)
+        qc.compose(cx_ladder(num_qubits, reverse=True), inplace=True)
 
         if self.measure:
-            qc.measure_all()
+            add_measure_tail(qc)
 
         return qc
 
@@ -9,9 +9,12 @@ This script helps you:
 """
 
 import logging
+import os
+import sys
 from pathlib import Path
-from utils.azure_connection import AzureConnection
-from utils.table_storage import list_circuits_from_table
+from utils.azure_connection import get_azure_connection
+from utils.table_storage import list_circuits_from_table, iter_circuit_hashes
+from utils.local_index import index_exists, index_count, index_diff
 from config import get_storage_config
 
 # Configure logging
@@ -30,7 +33,7 @@ def list_azure_circuits(limit=100):
     
     try:
         # Connect to Azure
-        azure_conn = AzureConnection()
+        azure_conn = get_azure_connection()
         table_client = azure_conn.get_circuits_table_client()
         
         # List circuits
@@ -47,15 +50,19 @@ def list_azure_circuits(limit=100):
         print(f"{'Hash (first 16)':<20} {'Qubits':<8} {'Depth':<8} {'Size':<8} {'Uploaded'}")
         print("-" * 80)
         
-        # Print circuits
-        for circuit in circuits:
-            hash_short = circuit['qpy_sha256'][:16] if circuit.get('qpy_sha256') else 'N/A'
-            qubits = circuit.get('num_qubits', 'N/A')
-            depth = circuit.get('circuit_depth', 'N/A')
-            size = circuit.get('circuit_size', 'N/A')
-            timestamp = circuit.get('timestamp', 'N/A')
-            
-            print(f"{hash_short:<20} {qubits:<8} {depth:<8} {size:<8} {timestamp}")
+        # Format every row first, then write the table in one call
+        row_format = "{:<20} {:<8} {:<8} {:<8} {}".format
+        lines = [
+            row_format(
+                circuit['qpy_sha256'][:16] if circuit.get('qpy_sha256') else 'N/A',
+                circuit.get('num_qubits', 'N/A'),
+                circuit.get('circuit_depth', 'N/A'),
+                circuit.get('circuit_size', 'N/A'),
+                circuit.get('timestamp', 'N/A'),
+            )
+            for circuit in circuits
+        ]
+        sys.stdout.write("\n".join(lines) + "\n")
         
         print("=" * 80)
         
@@ -64,6 +71,19 @@ def list_azure_circuits(limit=100):
         logger.error(f"Failed to list circuits: {e}")
 
 
+def _scan_local_hashes(circuits_dir: Path) -> set:
+    """Collect hashes of complete circuit directories by scanning the filesystem."""
+    hashes = set()
+    # scandir yields cached d_type info, so is_dir() needs no extra stat()
+    with os.scandir(circuits_dir) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False) and not entry.name.startswith('.'):
+                if (os.path.exists(os.path.join(entry.path, "circuit.qpy"))
+                        and os.path.exists(os.path.join(entry.path, "meta.json"))):
+                    hashes.add(entry.name)
+    return hashes
+
+
 def count_local_circuits():
     """Count circuits in the local storage directory."""
     storage_config = get_storage_config()
@@ -72,54 +92,71 @@ def count_local_circuits():
     if not circuits_dir.exists():
         return 0
     
-    count = 0
-    for item in circuits_dir.iterdir():
-        if item.is_dir() and not item.name.startswith('.'):
-            qpy_file = item / "circuit.qpy"
-            meta_file = item / "meta.json"
-            if qpy_file.exists() and meta_file.exists():
-                count += 1
+    # Once it exists the sqlite index covers older directories too: they are
+    # backfilled the first time the index is opened
+    if index_exists(circuits_dir):
+        return index_count(circuits_dir)
     
-    return count
+    return len(_scan_local_hashes(circuits_dir))
+
+
+def _print_hash_sample(hashes, limit=10):
+    """Print the first few hashes of a difference set."""
+    lines = [f"    {circuit_hash}" for circuit_hash in hashes[:limit]]
+    if len(hashes) > limit:
+        lines.append(f"    ... and {len(hashes) - limit} more")
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
 
 
 def compare_storage():
-    """Compare local and Azure storage."""
+    """Compare local and Azure storage circuit by circuit."""
     print("=" * 80)
     print("Storage Comparison")
     print("=" * 80)
     
-    # Count local circuits
-    local_count = count_local_circuits()
-    print(f"\nLocal circuits: {local_count}")
+    storage_config = get_storage_config()
+    circuits_dir = Path(storage_config['local_circuits_dir'])
     
-    # Count Azure circuits
     try:
-        azure_conn = AzureConnection()
+        azure_conn = get_azure_connection()
         table_client = azure_conn.get_circuits_table_client()
         
-        # Get all circuits (may be slow for large tables)
-        azure_circuits = list_circuits_from_table(table_client, limit=10000)
-        azure_count = len(azure_circuits)
+        # Only RowKeys are transferred, one page at a time
+        azure_hashes = iter_circuit_hashes(table_client)
         
+        if index_exists(circuits_dir):
+            # Stream Azure hashes into the (backfilled) local index and diff them in SQL
+            local_count = index_count(circuits_dir)
+            local_only, azure_only = index_diff(circuits_dir, azure_hashes)
+        else:
+            # No index yet: anti-join a directory scan against the Azure key set
+            local_set = _scan_local_hashes(circuits_dir) if circuits_dir.exists() else set()
+            azure_set = set(azure_hashes)
+            local_count = len(local_set)
+            local_only = sorted(local_set - azure_set)
+            azure_only = sorted(azure_set - local_set)
+        
+        azure_count = local_count - len(local_only) + len(azure_only)
+        print(f"\nLocal circuits: {local_count}")
         print(f"Azure circuits: {azure_count}")
         
         # Compare
-        if local_count > azure_count:
-            diff = local_count - azure_count
-            print(f"\n⚠ You have {diff} more circuits locally than in Azure")
+        if local_only:
+            print(f"\n⚠ {len(local_only)} local circuits are missing from Azure:")
+            _print_hash_sample(local_only)
             print("  Consider running: python upload_circuits_to_azure.py")
-        elif azure_count > local_count:
-            diff = azure_count - local_count
-            print(f"\n✓ Azure has {diff} more circuits than local storage")
-        else:
+        if azure_only:
+            print(f"\n✓ {len(azure_only)} Azure circuits are not in local storage:")
+            _print_hash_sample(azure_only)
+        if not local_only and not azure_only:
             print("\n✓ Local and Azure storage are in sync")
         
         print("=" * 80)
         
     except Exception as e:
         print(f"\n✗ Error accessing Azure: {e}")
-        logger.error(f"Failed to count Azure circuits: {e}")
+        logger.error(f"Failed to compare Azure circuits: {e}")
 
 
 def check_circuit_exists(circuit_hash: str):
@@ -131,7 +168,7 @@ def check_circuit_exists(circuit_hash: str):
     try:
         from utils.table_storage import get_circuit_metadata_from_table
         
-        azure_conn = AzureConnection()
+        azure_conn = get_azure_connection()
         table_client = azure_conn.get_circuits_table_client()
         
         metadata = get_circuit_metadata_from_table(table_client, circuit_hash)
@@ -139,9 +176,14 @@ def check_circuit_exists(circuit_hash: str):
         if metadata:
             print("\n✓ Circuit found in Azure Table Storage")
             print("\nMetadata:")
-            for key, value in sorted(metadata.items()):
-                if key not in ['PartitionKey', 'RowKey', 'Timestamp', 'etag']:
-                    print(f"  {key}: {value}")
+            # A row carries every extracted feature; emit them in one write
+            lines = [
+                f"  {key}: {value}"
+                for key, value in sorted(metadata.items())
+                if key not in ('PartitionKey', 'RowKey', 'Timestamp', 'etag')
+            ]
+            if lines:
+                sys.stdout.write("\n".join(lines) + "\n")
         else:
             print("\n✗ Circuit not found in Azure Table Storage")
         
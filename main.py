@@ -1,19 +1,26 @@
 from generators.circuit_merger import CircuitMerger
 from generators.lib.generator import BaseParams
-from config import get_circuit_config, get_simulation_config, get_storage_config, apply_optimizations,get_azure_config
+from config import get_circuit_config, get_pipeline_config, get_simulation_config, get_storage_config, apply_optimizations,get_azure_config
 
 from utils.save_utils import (
+    BatchedMetadataWriter,
+    get_circuit_entity,
     save_circuit_locally,
     save_circuit_metadata_to_table,
     upload_circuit_blob
 )
-from utils.azure_connection import AzureConnection
+from utils.azure_connection import AzureConnection, get_azure_connection
+from utils.upload_filter import get_upload_filter
 
 from feature_extractors.extractors import extract_features
 from simulators.simulate import QuantumSimulator
 
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from pathlib import Path
+import multiprocessing as mp
 import logging
+import threading
 
 
 # Suppress verbose Qiskit logging
@@ -33,10 +40,30 @@ logging.getLogger('azure.core').setLevel(logging.WARNING)
 logging.basicConfig(level=logging.WARNING, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
-def run_extraction_pipeline(circuitMerger: CircuitMerger, quantumSimulator: QuantumSimulator, azure_conn: AzureConnection = None):
+def run_extraction_pipeline(circuitMerger: CircuitMerger, quantumSimulator: QuantumSimulator, azure_conn: AzureConnection = None, metadata_writer: BatchedMetadataWriter = None):
     # Minimal logging for HPC - only essential messages
+    circ, qpy_hash, features, written = generate_and_store_circuit(circuitMerger, quantumSimulator)
+    upload_circuit_to_cloud(circ, qpy_hash, features, written, azure_conn, metadata_writer)
+    
+    logger.info("\n" + "=" * 60)
+    logger.info("PIPELINE COMPLETED SUCCESSFULLY")
+    logger.info("=" * 60)
+
+
+def generate_and_store_circuit(circuitMerger: CircuitMerger, quantumSimulator: QuantumSimulator):
+    """
+    Run Steps 1-4 (generation, features, simulation, local storage) for one circuit.
+
+    Returns:
+        tuple: (circuit, qpy_hash, features, written)
+    """
+    circ = generate_circuit(circuitMerger)
+    return process_and_store_circuit(circ, quantumSimulator)
+
+
+def generate_circuit(circuitMerger: CircuitMerger):
+    """Run Step 1 (circuit generation) on its own so it can be prefetched."""
     circuit_config=get_circuit_config()
-    storage_config=get_storage_config()
     
     # Step 1: Circuit Generation
     logger.info("STEP 1: Circuit Generation")
@@ -46,18 +73,33 @@ def run_extraction_pipeline(circuitMerger: CircuitMerger, quantumSimulator: Quan
             stopping_probability=circuit_config['stopping_probability'],
             max_generators=circuit_config['max_generators']
         )
-        logger.info(f"✓ Generated circuit: {circ.num_qubits} qubits, depth {circ.depth()}, size {circ.size()}")
+        if logger.isEnabledFor(logging.INFO):
+            # depth() and size() walk every instruction; skip them when INFO is off
+            logger.info("✓ Generated circuit: %d qubits, depth %d, size %d", circ.num_qubits, circ.depth(), circ.size())
     except Exception as e:
         logger.error(f"Circuit generation failed: {e}")
         raise
     
+    return circ
+
+
+def process_and_store_circuit(circ, quantumSimulator: QuantumSimulator):
+    """
+    Run Steps 2-4 (features, simulation, local storage) for an already generated circuit.
+
+    Returns:
+        tuple: (circuit, qpy_hash, features, written)
+    """
+    storage_config=get_storage_config()
+    
     # Step 2: Feature Extraction
     logger.info("\nSTEP 2: Feature Extraction")
     logger.info("-" * 30)
     try:
         extracted_features = extract_features(circuit=circ)
-        logger.info(f"✓ Feature extraction completed: {len(extracted_features)} features")
-        logger.debug(f"Feature keys: {list(extracted_features.keys())}")
+        logger.info("✓ Feature extraction completed: %d features", len(extracted_features))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Feature keys: %s", list(extracted_features.keys()))
     except Exception as e:
         logger.error(f"Feature extraction failed: {e}")
         raise
@@ -69,7 +111,7 @@ def run_extraction_pipeline(circuitMerger: CircuitMerger, quantumSimulator: Quan
         res = quantumSimulator.simulate_all_methods(circ)
         successful_sims = sum(1 for r in res.values() if r.get('success', False))
         total_sims = len(res)
-        logger.info(f"✓ Simulation completed: {successful_sims}/{total_sims} methods successful")
+        logger.info("✓ Simulation completed: %d/%d methods successful", successful_sims, total_sims)
     except Exception as e:
         logger.error(f"Simulation failed: {e}")
         raise
@@ -93,29 +135,75 @@ def run_extraction_pipeline(circuitMerger: CircuitMerger, quantumSimulator: Quan
         storage_path.mkdir(parents=True, exist_ok=True)
         qpy_hash, features, written = save_circuit_locally(circ, combined_features, storage_path)
         if written:
-            logger.info(f"✓ Circuit saved locally with hash: {qpy_hash}")
-            logger.info(f"✓ Serialization method: {features.get('serialization_method', 'unknown')}")
+            logger.info("✓ Circuit saved locally with hash: %s", qpy_hash)
+            logger.info("✓ Serialization method: %s", features.get('serialization_method', 'unknown'))
         else:
-            logger.info(f"Circuit {qpy_hash} already exists locally")
+            logger.info("Circuit %s already exists locally", qpy_hash)
     except Exception as e:
         logger.error(f"Local storage failed: {e}")
         raise
     
+    return circ, qpy_hash, features, written
+
+
+# Hashes currently being uploaded by any thread of this process
+_uploads_in_flight = set()
+_uploads_in_flight_lock = threading.Lock()
+
+
+def upload_circuit_to_cloud(circ, qpy_hash: str, features: dict, written: bool, azure_conn: AzureConnection = None, metadata_writer: BatchedMetadataWriter = None):
+    """Run Step 5 (blob + table upload) for a circuit produced by generate_and_store_circuit."""
     # Step 5: Cloud Storage (if available)
     if written and azure_conn:
         logger.info("\nSTEP 5: Cloud Storage")
         logger.info("-" * 30)
         
+        # Claim the hash so a concurrent upload of the same circuit is dropped
+        with _uploads_in_flight_lock:
+            if qpy_hash in _uploads_in_flight:
+                logger.info("Circuit %s is already being uploaded - skipping cloud storage", qpy_hash)
+                return
+            _uploads_in_flight.add(qpy_hash)
         try:
-            # Sub-step 5a: Blob Storage
-            logger.info("5a. Uploading to Azure Blob Storage...")
-            container_client = azure_conn.get_container_client()
-            serialization_method = features.get('serialization_method', 'qpy')
-            blob_path = upload_circuit_blob(container_client, circ, qpy_hash, serialization_method)
-            features["blob_path"] = blob_path.split("circuits/")[1] if "circuits/" in blob_path else blob_path
-            logger.info(f"✓ Circuit uploaded to blob storage")
-            
-            # Sub-step 5b: Table Storage
+            _upload_circuit(circ, qpy_hash, features, azure_conn, metadata_writer)
+        finally:
+            with _uploads_in_flight_lock:
+                _uploads_in_flight.discard(qpy_hash)
+    
+    elif written:
+        logger.info("\nSTEP 5: Cloud Storage")
+        logger.info("-" * 30)
+        logger.info("Azure connection not provided - skipping cloud storage")
+    elif azure_conn:
+        logger.info("\nSTEP 5: Cloud Storage")
+        logger.info("-" * 30)
+        logger.info("Circuit already exists - skipping cloud storage")
+
+
+def _upload_circuit(circ, qpy_hash: str, features: dict, azure_conn: AzureConnection, metadata_writer: BatchedMetadataWriter = None):
+    """Upload one circuit's blob and metadata; failures are logged, not raised."""
+    try:
+        # A filter hit may be a false positive, so confirm it with one table read
+        uploaded_filter = get_upload_filter()
+        if qpy_hash in uploaded_filter and get_circuit_entity(azure_conn.get_circuits_table_client(), qpy_hash) is not None:
+            logger.info("Circuit %s already uploaded - skipping cloud storage", qpy_hash)
+            return
+        
+        # Sub-step 5a: Blob Storage
+        logger.info("5a. Uploading to Azure Blob Storage...")
+        container_client = azure_conn.get_container_client()
+        serialization_method = features.get('serialization_method', 'qpy')
+        blob_path = upload_circuit_blob(container_client, circ, qpy_hash, serialization_method)
+        features["blob_path"] = blob_path.split("circuits/")[1] if "circuits/" in blob_path else blob_path
+        logger.info("✓ Circuit uploaded to blob storage")
+        uploaded_filter.add(qpy_hash)
+        
+        # Sub-step 5b: Table Storage
+        if metadata_writer is not None:
+            # Buffered; submitted in transactional batches by the writer
+            logger.info("5b. Queueing metadata for batched Azure Table upload...")
+            metadata_writer.add(features)
+        else:
             logger.info("5b. Saving metadata to Azure Table Storage...")
             table_client = azure_conn.get_circuits_table_client()
             table_success = save_circuit_metadata_to_table(table_client, features)
@@ -124,23 +212,190 @@ def run_extraction_pipeline(circuitMerger: CircuitMerger, quantumSimulator: Quan
                 logger.info("✓ Circuit metadata saved to Azure Table Storage")
             else:
                 logger.error("✗ Failed to save metadata to Azure Table Storage")
-                
+            
+    except Exception as e:
+        logger.error(f"Cloud storage failed: {e}")
+        logger.info("Circuit is still available locally")
+
+
+class BackgroundUploader:
+    """
+    Run Step 5 uploads on a small thread pool so network I/O overlaps with the
+    next circuit's CPU-bound processing.
+
+    At most max_in_flight uploads are pending; submitting beyond that waits for
+    the oldest one. Upload errors are logged, never raised, as in Step 5.
+    """
+
+    def __init__(self, azure_conn: AzureConnection = None, metadata_writer: BatchedMetadataWriter = None, max_workers: int = 4, max_in_flight: int = 16):
+        self.azure_conn = azure_conn
+        self.metadata_writer = metadata_writer
+        self.max_in_flight = max_in_flight
+        self._io_pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="upload")
+        self._in_flight = deque()
+
+    def submit(self, circ, qpy_hash: str, features: dict, written: bool):
+        """Queue one circuit's cloud upload without blocking on the network."""
+        while len(self._in_flight) >= self.max_in_flight:
+            self._wait(self._in_flight.popleft())
+        self._in_flight.append(self._io_pool.submit(
+            upload_circuit_to_cloud, circ, qpy_hash, features, written, self.azure_conn, self.metadata_writer
+        ))
+
+    def drain(self):
+        """Wait for every pending upload and stop the I/O threads."""
+        while self._in_flight:
+            self._wait(self._in_flight.popleft())
+        self._io_pool.shutdown(wait=True)
+
+    @staticmethod
+    def _wait(future):
+        try:
+            future.result()
         except Exception as e:
             logger.error(f"Cloud storage failed: {e}")
-            logger.info("Circuit is still available locally")
-            
-    elif written:
-        logger.info("\nSTEP 5: Cloud Storage")
-        logger.info("-" * 30)
-        logger.info("Azure connection not provided - skipping cloud storage")
-    elif azure_conn:
-        logger.info("\nSTEP 5: Cloud Storage")
-        logger.info("-" * 30)
-        logger.info("Circuit already exists - skipping cloud storage")
-    
-    logger.info("\n" + "=" * 60)
-    logger.info("PIPELINE COMPLETED SUCCESSFULLY")
-    logger.info("=" * 60)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.drain()
+        return False
+
+
+def _build_uploader(azure_conn: AzureConnection = None, metadata_writer: BatchedMetadataWriter = None):
+    """Create a BackgroundUploader sized from the Azure configuration."""
+    azure_config = get_azure_config()
+    return BackgroundUploader(
+        azure_conn,
+        metadata_writer,
+        max_workers=azure_config['upload_workers'],
+        max_in_flight=azure_config['max_uploads_in_flight']
+    )
+
+
+def run_sequential_extraction(circuitMerger: CircuitMerger, quantumSimulator: QuantumSimulator, num_circuits: int, azure_conn: AzureConnection = None, metadata_writer: BatchedMetadataWriter = None):
+    """
+    Run the extraction pipeline num_circuits times in this process.
+
+    The next circuit is generated on a helper thread while the current one is
+    analysed and simulated; Aer releases the GIL, so the two overlap. Circuits
+    are still generated one after another from the same merger, so the seeded
+    sequence is unchanged.
+
+    Returns:
+        tuple: (succeeded, failed) circuit counts
+    """
+    succeeded = failed = 0
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix="prefetch") as gen_pool, \
+            _build_uploader(azure_conn, metadata_writer) as uploader:
+        next_future = gen_pool.submit(generate_circuit, circuitMerger)
+        for i in range(num_circuits):
+            circ_future = next_future
+            if i + 1 < num_circuits:
+                next_future = gen_pool.submit(generate_circuit, circuitMerger)
+            try:
+                circ = circ_future.result()
+                circ, qpy_hash, features, written = process_and_store_circuit(circ, quantumSimulator)
+            except Exception as e:
+                failed += 1
+                logger.error(f"Pipeline iteration failed: {e}")
+                continue
+            uploader.submit(circ, qpy_hash, features, written)
+            succeeded += 1
+    return succeeded, failed
+
+
+def _build_components(seed_offset: int = 0):
+    """Create a CircuitMerger and QuantumSimulator from config, offsetting both seeds."""
+    circuit_config = get_circuit_config()
+    simulation_config = get_simulation_config()
+
+    base_params = BaseParams(
+        max_qubits=circuit_config['max_qubits'], 
+        min_qubits=circuit_config['min_qubits'], 
+        max_depth=circuit_config['max_depth'], 
+        min_depth=circuit_config['min_depth'], 
+        seed=circuit_config['seed'] + seed_offset, 
+        measure=circuit_config['measure']
+    )
+    circuitMerger = CircuitMerger(base_params=base_params)
+    quantumSimulator = QuantumSimulator(
+        seed=simulation_config['seed'] + seed_offset, 
+        shots=simulation_config['shots'],
+        timeout_seconds=simulation_config['timeout_seconds']
+    )
+    return circuitMerger, quantumSimulator
+
+
+# This process's CircuitMerger and QuantumSimulator (see _get_process_components)
+_process_components = {}
+
+
+def _get_process_components(seed_offset: int = 0):
+    """
+    Return this process's CircuitMerger and QuantumSimulator, seeded for one circuit.
+
+    Building them loads every generator and one AerSimulator per method, so
+    they are created once per process and only re-seeded afterwards.
+    """
+    if not _process_components:
+        merger, simulator = _build_components(seed_offset)
+        _process_components['circuit_merger'] = merger
+        _process_components['quantum_simulator'] = simulator
+    else:
+        _process_components['circuit_merger'].reseed(get_circuit_config()['seed'] + seed_offset)
+        _process_components['quantum_simulator'].reseed(get_simulation_config()['seed'] + seed_offset)
+    return _process_components['circuit_merger'], _process_components['quantum_simulator']
+
+
+def _worker(seed_offset: int):
+    """
+    Process-pool entry point: generate, analyse and store one circuit locally.
+
+    Cloud uploads are left to the parent so workers never authenticate to Azure.
+    """
+    circuitMerger, quantumSimulator = _get_process_components(seed_offset)
+    return generate_and_store_circuit(circuitMerger, quantumSimulator)
+
+
+def _get_mp_context():
+    """
+    Choose the start method for the worker pool, as PipelineManager does.
+
+    Where fork is available the components are built once in this process
+    and inherited copy-on-write by every worker; elsewhere each worker
+    builds its own on its first circuit.
+    """
+    if 'fork' not in mp.get_all_start_methods():
+        return mp.get_context()
+    _get_process_components()
+    return mp.get_context('fork')
+
+
+def run_parallel_extraction(num_circuits: int, num_workers: int, azure_conn: AzureConnection = None, metadata_writer: BatchedMetadataWriter = None):
+    """
+    Run the extraction pipeline for num_circuits seeds across a process pool.
+
+    Returns:
+        tuple: (succeeded, failed) circuit counts
+    """
+    succeeded = failed = 0
+    with ProcessPoolExecutor(max_workers=num_workers, mp_context=_get_mp_context()) as pool:
+        # The fork pool starts its workers on the first submit, before the
+        # uploader has created any threads in this process
+        futures = [pool.submit(_worker, offset) for offset in range(num_circuits)]
+        with _build_uploader(azure_conn, metadata_writer) as uploader:
+            for future in as_completed(futures):
+                try:
+                    circ, qpy_hash, features, written = future.result()
+                except Exception as e:
+                    failed += 1
+                    logger.error(f"Pipeline worker failed: {e}")
+                    continue
+                uploader.submit(circ, qpy_hash, features, written)
+                succeeded += 1
+    return succeeded, failed
 
 
 def main():
@@ -150,21 +405,20 @@ def main():
     logger.info("🚀 Starting Quantum Circuit Processing Application")
     logger.info("=" * 80)
     
-    # Get circuit, simulation, and storage configuration
+    # Get circuit, pipeline, and storage configuration
     circuit_config = get_circuit_config()
-    simulation_config = get_simulation_config()
-    storage_config = get_storage_config()
+    pipeline_config = get_pipeline_config()
     azure_config = get_azure_config()
 
     seed = circuit_config['seed']
-    logger.info(f"Using random seed: {seed}")
+    logger.info("Using random seed: %s", seed)
     
     azure_conn=None
     # Initialize Azure connection for cloud storage
     logger.info("\nInitializing Azure Connection...")
     if azure_config['enabled']:
         try:
-            azure_conn = AzureConnection()
+            azure_conn = get_azure_connection()
             logger.warning("✓ Azure connection established for remote storage")
         except Exception as e:
             logger.warning(f"⚠️  Azure connection failed: {e}")
@@ -174,43 +428,49 @@ def main():
 
     # Configure circuit generation using centralized config
     logger.info("\nConfiguring Circuit Generation...")
-    base_params = BaseParams(
-        max_qubits=circuit_config['max_qubits'], 
-        min_qubits=circuit_config['min_qubits'], 
-        max_depth=circuit_config['max_depth'], 
-        min_depth=circuit_config['min_depth'], 
-        seed=seed, 
-        measure=circuit_config['measure']
-    )
-    logger.info(f"Circuit parameters: {base_params.min_qubits}-{base_params.max_qubits} qubits, {base_params.min_depth}-{base_params.max_depth} depth")
-    
-    try:
-        circuitMerger = CircuitMerger(base_params=base_params)
-        logger.info("✓ Circuit merger initialized")
-    except Exception as e:
-        logger.error(f"Failed to initialize circuit merger: {e}")
-        raise
+    logger.info("Circuit parameters: %d-%d qubits, %d-%d depth", circuit_config['min_qubits'], circuit_config['max_qubits'], circuit_config['min_depth'], circuit_config['max_depth'])
+    num_circuits = pipeline_config['max_iterations'] or 1
+    num_workers = min(pipeline_config['workers'], num_circuits)
 
-    # Initialize quantum simulator
-    logger.info("\nInitializing Quantum Simulator...")
-    try:
-        quantumSimulator = QuantumSimulator(
-            seed=simulation_config['seed'], 
-            shots=simulation_config['shots'],
-            timeout_seconds=simulation_config['timeout_seconds']
+    # Batch table metadata writes instead of one round-trip per circuit
+    metadata_writer = None
+    if azure_conn:
+        metadata_writer = BatchedMetadataWriter(
+            azure_conn.get_circuits_table_client(),
+            batch_size=azure_config['table_batch_size']
         )
-        logger.info("✓ Quantum simulator initialized")
-    except Exception as e:
-        logger.error(f"Failed to initialize quantum simulator: {e}")
-        raise
-    
+
     # Run the extraction pipeline
     logger.info("\nStarting Pipeline Execution...")
     try:
-        run_extraction_pipeline(circuitMerger, quantumSimulator, azure_conn)
+        if num_workers > 1:
+            logger.warning(f"Processing {num_circuits} circuits across {num_workers} worker processes")
+            succeeded, failed = run_parallel_extraction(num_circuits, num_workers, azure_conn, metadata_writer)
+            logger.warning(f"✓ {succeeded} circuits processed, {failed} failed")
+        else:
+            # Initialize circuit merger and quantum simulator
+            try:
+                circuitMerger, quantumSimulator = _build_components()
+                logger.info("✓ Circuit merger and quantum simulator initialized")
+            except Exception as e:
+                logger.error(f"Failed to initialize pipeline components: {e}")
+                raise
+            if num_circuits > 1:
+                logger.warning(f"Processing {num_circuits} circuits in one process with generation prefetch")
+                succeeded, failed = run_sequential_extraction(circuitMerger, quantumSimulator, num_circuits, azure_conn, metadata_writer)
+                logger.warning(f"✓ {succeeded} circuits processed, {failed} failed")
+            else:
+                run_extraction_pipeline(circuitMerger, quantumSimulator, azure_conn, metadata_writer)
         logger.info("\n🎉 Application completed successfully!")
     except Exception as e:
         logger.error(f"\n💥 Application failed: {e}")
         raise
+    finally:
+        if azure_conn:
+            get_upload_filter().save()
+        if metadata_writer is not None:
+            metadata_writer.flush()
+            if metadata_writer.failed:
+                logger.error(f"✗ Failed to save {metadata_writer.failed} metadata entities to Azure Table Storage")
 if __name__ == "__main__":
     main()
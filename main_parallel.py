@@ -18,6 +18,7 @@ Author: InferQ Pipeline System
 import os
 import sys
 import logging
+import logging.handlers
 import signal
 import multiprocessing as mp
 import numpy as np
@@ -33,7 +34,10 @@ np.set_printoptions(suppress=True, threshold=0)
 
 # Configure logging using centralized config
 log_config = config.LOGGING
-file_handler = logging.FileHandler('pipeline.log')
+# Rotate so an indefinite run cannot grow pipeline.log without bound
+file_handler = logging.handlers.RotatingFileHandler(
+    'pipeline.log', maxBytes=64 << 20, backupCount=4
+)
 file_handler.setLevel(getattr(logging, log_config['level']))
 
 console_handler = logging.StreamHandler(sys.stdout)
@@ -97,6 +101,61 @@ def signal_handler(signum, frame):
         signal_handler.call_count = 1
 
 
+def _run_log_listener(log_queue) -> None:
+    """Write queued records to the file and console handlers until None arrives."""
+    # Ctrl-C reaches the whole process group; keep writing until main() stops us
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    while True:
+        try:
+            record = log_queue.get()
+        except EOFError:
+            break
+        if record is None:
+            break
+        for handler in (file_handler, console_handler):
+            if record.levelno >= handler.level:
+                handler.handle(record)
+
+
+class _SimpleQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler for a multiprocessing.SimpleQueue, which has no put_nowait()."""
+    
+    def enqueue(self, record):
+        self.queue.put(record)
+
+
+class LogListener:
+    """
+    Route the root logger through a queue for the duration of a run.
+    
+    Loggers only enqueue records; a separate process does the file and console
+    writes. SimpleQueue.put() writes to the pipe directly instead of through a
+    feeder thread, so this process stays single-threaded and the worker pool
+    can fork it safely. Forked workers log through the same queue.
+    """
+    
+    def __init__(self):
+        self.queue = mp.SimpleQueue()
+        self._process = mp.Process(
+            target=_run_log_listener, args=(self.queue,), name="log-listener", daemon=True
+        )
+        # The queue handler only merges args (and any traceback) into the message;
+        # the listener's handlers apply the real format
+        self._queue_handler = _SimpleQueueHandler(self.queue)
+        self._queue_handler.setFormatter(logging.Formatter('%(message)s'))
+    
+    def start(self) -> None:
+        """Start the listener process and send all root logger records to it."""
+        self._process.start()
+        logging.getLogger().handlers[:] = [self._queue_handler]
+    
+    def stop(self) -> None:
+        """Drain the queue, stop the listener and log directly again."""
+        logging.getLogger().handlers[:] = [file_handler, console_handler]
+        self.queue.put(None)
+        self._process.join()
+
+
 def main():
     """Main entry point with command line argument support."""
     import argparse
@@ -120,33 +179,39 @@ def main():
     
     args = parser.parse_args()
     
-    # Performance profiling (optional)
-    if args.profile:
-        import cProfile
-        import pstats
-        
-        profiler = cProfile.Profile()
-        profiler.enable()
-        
-        try:
+    log_listener = LogListener()
+    log_listener.start()
+    try:
+        # Performance profiling (optional)
+        if args.profile:
+            import cProfile
+            import pstats
+            
+            profiler = cProfile.Profile()
+            profiler.enable()
+            
+            try:
+                run_parallel_pipeline(
+                    num_workers=args.workers,
+                    max_iterations=args.iterations,
+                    batch_size=args.batch_size,
+                    azure_upload_interval=args.azure_interval
+                )
+            finally:
+                profiler.disable()
+                stats = pstats.Stats(profiler)
+                stats.sort_stats('cumulative')
+                stats.print_stats(20)  # Top 20 functions
+        else:
             run_parallel_pipeline(
                 num_workers=args.workers,
                 max_iterations=args.iterations,
                 batch_size=args.batch_size,
                 azure_upload_interval=args.azure_interval
             )
-        finally:
-            profiler.disable()
-            stats = pstats.Stats(profiler)
-            stats.sort_stats('cumulative')
-            stats.print_stats(20)  # Top 20 functions
-    else:
-        run_parallel_pipeline(
-            num_workers=args.workers,
-            max_iterations=args.iterations,
-            batch_size=args.batch_size,
-            azure_upload_interval=args.azure_interval
-        )
+    finally:
+        # Drain queued records before the interpreter exits
+        log_listener.stop()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -12,16 +12,30 @@ for quantum circuits with the following components:
 Author: InferQ Pipeline System
 """
 
-from .manager import run_parallel_pipeline, PipelineManager
-from .worker import run_single_pipeline
-from .azure_manager import upload_batch_to_azure
-from .system_utils import monitor_system_resources, cleanup_old_circuits
-
-__all__ = [
-    'run_parallel_pipeline',
-    'PipelineManager', 
-    'run_single_pipeline',
-    'upload_batch_to_azure',
-    'monitor_system_resources',
-    'cleanup_old_circuits'
-]
\ No newline at end of file
+import importlib
+
+# Submodules are imported on first attribute access (PEP 562), so importing
+# one piece of the package does not pull in qiskit, Aer and the Azure SDK
+_LAZY_EXPORTS = {
+    'run_parallel_pipeline': 'pipeline.manager',
+    'PipelineManager': 'pipeline.manager',
+    'run_single_pipeline': 'pipeline.worker',
+    'upload_batch_to_azure': 'pipeline.azure_manager',
+    'monitor_system_resources': 'pipeline.system_utils',
+    'cleanup_old_circuits': 'pipeline.system_utils',
+}
+
+__all__ = list(_LAZY_EXPORTS)
+
+
+def __getattr__(name):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -10,21 +10,79 @@ Author: InferQ Pipeline System
 """
 
 import logging
-from typing import List, Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Optional
 
 from utils.azure_connection import AzureConnection
-from utils.save_utils import upload_circuit_blob, save_circuit_metadata_to_table
+from utils.save_utils import upload_circuit_file_blob, BatchedMetadataWriter
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
-def upload_batch_to_azure(circuit_batch: List[Dict[str, Any]], azure_conn: AzureConnection) -> Dict[str, Any]:
+def _upload_one(index: int, total: int, result: Dict[str, Any], container_client,
+                metadata_writer: BatchedMetadataWriter) -> bool:
+    """
+    Upload one circuit blob and queue its metadata row.
+    
+    Args:
+        index: 1-based position of the circuit in the batch (for logging)
+        total: Batch size (for logging)
+        result: Worker result for the circuit
+        container_client: Blob container client
+        metadata_writer: Writer that batches the table rows into transactions
+        
+    Returns:
+        True if the blob was stored and its metadata queued, False otherwise
+    """
+    qpy_hash = result['circuit_hash']
+    
+    if not result.get('circuit_path'):
+        logger.warning(
+            "❌ AZURE UPLOAD SKIPPED [%d/%d]: Circuit %.8s... has no serialized circuit file",
+            index, total, qpy_hash,
+        )
+        return False
+    
+    try:
+        features = result['features']
+        worker_id = result.get('worker_id', 'unknown')
+        
+        logger.debug(
+            "☁️  UPLOADING [%d/%d]: Circuit %.8s... from Worker-%s (%sq, depth=%s)",
+            index, total, qpy_hash, worker_id, result.get('circuit_qubits'), result.get('circuit_depth'),
+        )
+        
+        # Upload the file the worker saved locally to blob storage
+        blob_path = upload_circuit_file_blob(
+            container_client, result['circuit_path'], qpy_hash,
+            result['circuit_qubits'], result['circuit_depth'], result['circuit_size']
+        )
+        # Store the path relative to the circuits/ prefix (one scan, no list)
+        _, prefix, relative_path = blob_path.partition("circuits/")
+        features["blob_path"] = relative_path if prefix else blob_path
+        
+        # Queue metadata; rows are written in per-partition transactions
+        metadata_writer.add(features)
+        logger.debug("✅ AZURE BLOB UPLOADED [%d/%d]: Circuit %.8s... metadata queued", index, total, qpy_hash)
+        return True
+            
+    except Exception as e:
+        logger.warning("❌ AZURE UPLOAD FAILED [%d/%d]: Circuit %.8s... - %s", index, total, qpy_hash, e)
+        return False
+
+def upload_batch_to_azure(circuit_batch: List[Dict[str, Any]], azure_conn: AzureConnection,
+                          max_workers: Optional[int] = None) -> Dict[str, Any]:
     """
     Upload a batch of circuits to Azure storage in parallel.
     
+    Each circuit needs a blob upload and a table write; both are network-bound,
+    so blobs are uploaded from a thread pool to overlap the round-trips and
+    the table rows are upserted in transactions of up to 100 entities.
+    
     Args:
         circuit_batch: List of circuit results to upload
         azure_conn: Azure connection instance
+        max_workers: Concurrent uploads (default: upload_workers from Azure config)
         
     Returns:
         Dictionary with upload statistics including successful and failed hashes
@@ -32,8 +90,10 @@ def upload_batch_to_azure(circuit_batch: List[Dict[str, Any]], azure_conn: Azure
     if not azure_conn:
         return {'uploaded': 0, 'failed': 0, 'error': 'No Azure connection', 'successful_hashes': [], 'failed_hashes': []}
     
-    uploaded = 0
-    failed = 0
+    if max_workers is None:
+        from config import get_azure_config
+        max_workers = get_azure_config()['upload_workers']
+    
     successful_hashes = []
     failed_hashes = []
     
@@ -44,42 +104,36 @@ def upload_batch_to_azure(circuit_batch: List[Dict[str, Any]], azure_conn: Azure
         container_client = azure_conn.get_container_client()
         table_client = azure_conn.get_circuits_table_client()
         
-        for i, result in enumerate(circuit_batch, 1):
-            if not result.get('success') or not result.get('written'):
-                continue
-                
-            qpy_hash = result['circuit_hash']
-            
-            try:
-                circuit = result['circuit']
-                features = result['features']
-                serialization_method = result['serialization_method']
-                worker_id = result.get('worker_id', 'unknown')
-                
-                logger.debug(f"☁️  UPLOADING [{i}/{len(circuit_batch)}]: Circuit {qpy_hash[:8]}... from Worker-{worker_id} ({circuit.num_qubits}q, depth={circuit.depth()})")
-                
-                # Upload to blob storage
-                blob_path = upload_circuit_blob(
-                    container_client, circuit, qpy_hash, serialization_method
-                )
-                features["blob_path"] = blob_path.split("circuits/")[1] if "circuits/" in blob_path else blob_path
-                
-                # Save metadata to table storage
-                table_success = save_circuit_metadata_to_table(table_client, features)
-                
-                if table_success:
-                    uploaded += 1
-                    successful_hashes.append(qpy_hash)
-                    logger.debug(f"✅ AZURE SUCCESS [{i}/{len(circuit_batch)}]: Circuit {qpy_hash[:8]}... uploaded to cloud storage")
+        metadata_writer = BatchedMetadataWriter(table_client)
+        
+        total = len(circuit_batch)
+        jobs = [
+            (i, result) for i, result in enumerate(circuit_batch, 1)
+            if result.get('success') and result.get('written')
+        ]
+        
+        # The blob client and the metadata writer are thread-safe and shared by all uploads
+        blob_uploaded = []
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+            outcomes = executor.map(
+                lambda job: _upload_one(job[0], total, job[1], container_client, metadata_writer),
+                jobs
+            )
+            for (_, result), success in zip(jobs, outcomes):
+                if success:
+                    blob_uploaded.append(result['circuit_hash'])
                 else:
-                    failed += 1
-                    failed_hashes.append(qpy_hash)
-                    logger.warning(f"❌ AZURE METADATA FAILED [{i}/{len(circuit_batch)}]: Circuit {qpy_hash[:8]}... blob uploaded but metadata failed")
-                    
-            except Exception as e:
-                failed += 1
+                    failed_hashes.append(result['circuit_hash'])
+        
+        # Write the remaining partially filled partitions
+        metadata_writer.flush()
+        metadata_failed = set(metadata_writer.failed_hashes)
+        for qpy_hash in blob_uploaded:
+            if qpy_hash in metadata_failed:
                 failed_hashes.append(qpy_hash)
-                logger.warning(f"❌ AZURE UPLOAD FAILED [{i}/{len(circuit_batch)}]: Circuit {qpy_hash[:8]}... - {str(e)}")
+                logger.warning("❌ AZURE METADATA FAILED: Circuit %.8s... blob uploaded but metadata failed", qpy_hash)
+            else:
+                successful_hashes.append(qpy_hash)
                 
     except Exception as e:
         logger.warning(f"❌ AZURE BATCH FAILED: Critical error during batch upload - {str(e)}")
@@ -87,6 +141,9 @@ def upload_batch_to_azure(circuit_batch: List[Dict[str, Any]], azure_conn: Azure
         all_hashes = [result.get('circuit_hash') for result in circuit_batch if result.get('circuit_hash')]
         return {'uploaded': 0, 'failed': len(circuit_batch), 'error': str(e), 'successful_hashes': [], 'failed_hashes': all_hashes}
     
+    uploaded = len(successful_hashes)
+    failed = len(failed_hashes)
+    
     # Log the completion of Azure upload batch
     if uploaded > 0:
         logger.warning(f"🎉 AZURE UPLOAD COMPLETED: {uploaded} circuits successfully stored in cloud, {failed} failed")
@@ -12,17 +12,18 @@ Author: InferQ Pipeline System
 import time
 import logging
 import multiprocessing as mp
-from concurrent.futures import ProcessPoolExecutor, as_completed, TimeoutError
+import psutil
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, ThreadPoolExecutor, TimeoutError, wait
 from pathlib import Path
 from typing import Optional, Dict, Any, List, Set
 
-from utils.azure_connection import AzureConnection
+from utils.azure_connection import AzureConnection, get_azure_connection
 from utils.duplicate_detector import (
     initialize_duplicate_detection, get_duplicate_detector,
     mark_circuits_pending_upload, mark_circuits_uploaded_to_azure, mark_circuits_upload_failed,
-    coordinate_batch_session_hashes, get_current_session_hashes
+    coordinate_batch_session_hashes, get_current_session_hashes, SharedHashLog
 )
-from pipeline.worker import run_single_pipeline, setup_worker_signal_handling
+from pipeline.worker import run_pipeline_chunk, init_worker, warm_up_worker_components
 from config import get_pipeline_config, get_storage_config
 from pipeline.azure_manager import (
     upload_batch_to_azure, should_trigger_upload, 
@@ -30,12 +31,18 @@ from pipeline.azure_manager import (
 )
 from pipeline.system_utils import (
     monitor_system_resources, cleanup_old_circuits, log_system_startup,
-    should_cleanup, log_cleanup_results
+    should_cleanup, log_cleanup_results, throttle_on_memory_pressure
 )
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Result fields consumed by upload_batch_to_azure()
+_UPLOAD_FIELDS = (
+    'success', 'written', 'worker_id', 'circuit_hash', 'circuit_path',
+    'circuit_qubits', 'circuit_depth', 'circuit_size', 'features',
+)
+
 class PipelineManager:
     """
     High-performance parallel quantum circuit processing pipeline manager.
@@ -61,10 +68,14 @@ class PipelineManager:
         self.azure_upload_interval = azure_upload_interval
         
         # Get batch timeout from config if not provided
+        pipeline_config = get_pipeline_config()
         if batch_timeout_seconds is None:
-            pipeline_config = get_pipeline_config()
             batch_timeout_seconds = pipeline_config['batch_timeout_seconds']
         self.batch_timeout_seconds = batch_timeout_seconds
+        self.memory_throttle_percent = pipeline_config['memory_throttle_percent']
+        self.pin_workers = pipeline_config['pin_workers']
+        self.session_hash_log_capacity = pipeline_config['session_hash_log_capacity']
+        self.resource_sample_seconds = pipeline_config['resource_sample_seconds']
         
         self.azure_conn: Optional[AzureConnection] = None
         self.shutdown_flag = mp.Value('i', 0)
@@ -84,8 +95,19 @@ class PipelineManager:
         # Upload buffer
         self.upload_buffer: List[Dict[str, Any]] = []
         
-        # Session coordination
+        # Full buffers are uploaded in the background while the next batches
+        # run; results are applied on the manager thread when reaped
+        self._upload_executor: Optional[ThreadPoolExecutor] = None
+        self._pending_uploads: List[Future] = []
+        
+        # Session coordination: new hashes are published to the workers through
+        # a shared log; the full set is only sent with tasks once the log is full
         self.current_session_hashes: Set[str] = set()
+        self._session_hash_log: Optional[SharedHashLog] = None
+        
+        # Last system resource reading, reused by batch status lines until stale
+        self._last_resource_sample: Optional[Dict[str, Any]] = None
+        self._last_resource_sample_time = float('-inf')
     
     def initialize(self) -> bool:
         """
@@ -105,7 +127,7 @@ class PipelineManager:
             
             if azure_config['enabled']:
                 try:
-                    self.azure_conn = AzureConnection()
+                    self.azure_conn = get_azure_connection()
                     logger.warning("✓ Azure connection established for remote storage")
                 except Exception as e:
                     logger.warning(f"⚠️  Azure connection failed: {e}")
@@ -149,8 +171,12 @@ class PipelineManager:
         iteration = 0
         
         try:
+            mp_context = self._get_mp_context()
+            self._session_hash_log = SharedHashLog(self.session_hash_log_capacity, mp_context)
             with ProcessPoolExecutor(max_workers=self.num_workers, 
-                                   initializer=setup_worker_signal_handling) as executor:
+                                   initializer=init_worker,
+                                   initargs=(self._get_core_queue(mp_context), self._session_hash_log),
+                                   mp_context=mp_context) as executor:
                 
                 while max_iterations is None or iteration < max_iterations:
                     if self.shutdown_flag.value:
@@ -171,8 +197,8 @@ class PipelineManager:
                         
                         iteration += 1
                         
-                        # Brief pause to prevent system overload
-                        time.sleep(0.05)
+                        # Back off only while memory is under pressure
+                        throttle_on_memory_pressure(self.memory_throttle_percent)
                         
                     except KeyboardInterrupt:
                         logger.warning("KeyboardInterrupt in batch processing, setting shutdown flag...")
@@ -196,6 +222,52 @@ class PipelineManager:
         
         return self._get_final_stats()
     
+    def _get_mp_context(self):
+        """
+        Choose the start method for the worker pool.
+
+        Where fork is available the worker components are built once in this
+        process and inherited by every worker; elsewhere each worker builds
+        its own in init_worker.
+        
+        Returns:
+            Multiprocessing context for the ProcessPoolExecutor
+        """
+        if 'fork' not in mp.get_all_start_methods():
+            return mp.get_context()
+        try:
+            warm_up_worker_components()
+        except Exception as e:
+            logger.warning(f"⚠️  Worker warm-up failed, workers will initialize on their own: {e}")
+        return mp.get_context('fork')
+    
+    def _get_core_queue(self, mp_context):
+        """
+        Build the queue of CPU cores the workers pin themselves to.
+        
+        Workers take the lowest available cores; the remaining ones are left
+        for this process, the upload threads and the system.
+        
+        Args:
+            mp_context: Multiprocessing context of the worker pool
+            
+        Returns:
+            Queue of core IDs, or None if pinning is disabled or unsupported
+        """
+        if not self.pin_workers or not hasattr(psutil.Process, 'cpu_affinity'):
+            return None
+        try:
+            cores = sorted(psutil.Process().cpu_affinity())
+        except (psutil.Error, OSError):
+            return None
+        if len(cores) < self.num_workers:
+            # Not enough cores for one each; let the scheduler place workers
+            return None
+        core_queue = mp_context.Queue()
+        for core in cores[:self.num_workers]:
+            core_queue.put(core)
+        return core_queue
+    
     def _process_batch(self, executor: ProcessPoolExecutor, batch_size: int, iteration: int) -> List[Dict[str, Any]]:
         """
         Process a batch of circuits using the executor.
@@ -208,54 +280,66 @@ class PipelineManager:
         Returns:
             List of batch results
         """
-        # Submit batch of work
-        futures = []
-        for i in range(batch_size):
-            if self.shutdown_flag.value:
+        # Hand tasks to the workers in chunks: one IPC message per chunk
+        # instead of per circuit
+        if self.shutdown_flag.value:
+            return []
+        chunksize = max(1, batch_size // self.num_workers)
+        worker_ids = [i % self.num_workers for i in range(batch_size)]
+        seed_offsets = [iteration * batch_size + i for i in range(batch_size)]
+        # Workers read new session hashes from the shared log; the set only
+        # travels with the tasks once the log has run out of space
+        session_hashes = self.current_session_hashes if self._session_hash_log_full() else None
+        chunk_sizes = {}
+        for start in range(0, batch_size, chunksize):
+            chunk_ids = worker_ids[start:start + chunksize]
+            chunk = executor.submit(
+                run_pipeline_chunk, chunk_ids, seed_offsets[start:start + chunksize], session_hashes
+            )
+            chunk_sizes[chunk] = len(chunk_ids)
+        chunks = list(chunk_sizes)
+        
+        # Wait for chunks as they finish, so results of completed chunks are
+        # kept even when another chunk runs into the batch timeout
+        deadline = time.monotonic() + self.batch_timeout_seconds
+        pending = set(chunks)
+        while pending and not self.shutdown_flag.value:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
                 break
-            future = executor.submit(run_single_pipeline, i % self.num_workers, iteration * batch_size + i, self.current_session_hashes)
-            futures.append(future)
+            _, pending = wait(pending, timeout=remaining, return_when=FIRST_COMPLETED)
         
-        # Process completed work with timeout
+        # Collect results in submission order
         batch_results = []
-        for future in as_completed(futures, timeout=self.batch_timeout_seconds):
-            if self.shutdown_flag.value:
-                break
-            
+        timed_out = 0
+        for chunk in chunks:
+            if chunk in pending:
+                # Chunks that have not started are cancelled; running ones
+                # cannot be stopped and their results are dropped
+                chunk.cancel()
+                if not self.shutdown_flag.value:
+                    timed_out += chunk_sizes[chunk]
+                continue
             try:
-                result = future.result(timeout=1)  # Quick timeout since future is already done
-                batch_results.append(result)
-            except TimeoutError:
-                # This shouldn't happen since we're using as_completed with timeout
-                logger.warning("Individual future timed out unexpectedly")
-                batch_results.append({
-                    'success': False,
-                    'worker_id': -1,
-                    'error': 'Worker task timed out',
-                    'timeout': True,
-                    'timestamp': time.time()
-                })
+                batch_results.extend(chunk.result())
             except Exception as e:
                 logger.warning(f"Future result error: {e}")
-                batch_results.append({
+                batch_results.extend({
                     'success': False,
                     'worker_id': -1,
                     'error': f'Future error: {str(e)}',
                     'timestamp': time.time()
-                })
-        
-        # Handle any remaining futures that didn't complete within timeout
-        for future in futures:
-            if not future.done():
-                future.cancel()
-                logger.warning("Cancelled incomplete worker task due to timeout")
-                batch_results.append({
-                    'success': False,
-                    'worker_id': -1,
-                    'error': f'Worker task timed out after {self.batch_timeout_seconds}s',
-                    'timeout': True,
-                    'timestamp': time.time()
-                })
+                } for _ in range(chunk_sizes[chunk]))
+        
+        if timed_out:
+            logger.warning(f"Cancelled {timed_out} incomplete worker tasks due to timeout")
+            batch_results.extend({
+                'success': False,
+                'worker_id': -1,
+                'error': f'Worker task timed out after {self.batch_timeout_seconds}s',
+                'timeout': True,
+                'timestamp': time.time()
+            } for _ in range(timed_out))
         
         return batch_results
     
@@ -266,31 +350,32 @@ class PipelineManager:
         Args:
             batch_results: Results from the current batch
         """
-        # Collect session hashes from all workers for coordination
-        worker_session_hashes = []
+        # Gather session hashes and pending uploads for the whole batch so the
+        # duplicate detector is updated once instead of once per result
+        new_session_hashes = set()
+        pending_hashes = []
         
         for result in batch_results:
             self.stats['total_processed'] += 1
             
             # Collect worker session hashes
-            if 'worker_session_hashes' in result:
-                worker_session_hashes.append(result['worker_session_hashes'])
+            new_session_hashes.update(result.get('worker_session_hashes', ()))
             
             if result['success']:
                 self.stats['successful'] += 1
                 
                 # Log duplicate detection results
                 if result.get('duplicate', False):
-                    logger.debug(f"Worker-{result['worker_id']}: Duplicate circuit skipped")
+                    logger.debug("Worker-%s: Duplicate circuit skipped", result['worker_id'])
                 
                 # Add to upload buffer if Azure is available and circuit was written (not duplicate)
                 if self.azure_conn and result.get('written'):
-                    self.upload_buffer.append(result)
-                    # Mark circuit as pending upload in duplicate detector
+                    # Keep only what the uploader reads; entries can sit in
+                    # the buffer for up to azure_upload_interval results
+                    self.upload_buffer.append({key: result.get(key) for key in _UPLOAD_FIELDS})
                     circuit_hash = result.get('circuit_hash')
                     if circuit_hash:
-                        mark_circuits_pending_upload([circuit_hash])
-                        logger.debug(f"📤 Marked {circuit_hash[:8]}... as pending upload")
+                        pending_hashes.append(circuit_hash)
             else:
                 if result.get('timeout', False):
                     self.stats['timed_out'] += 1
@@ -299,37 +384,85 @@ class PipelineManager:
                     self.stats['failed'] += 1
                     logger.warning(f"Pipeline failed: {result.get('error', 'Unknown error')}")
         
+        # Mark written circuits as pending upload in duplicate detector
+        if pending_hashes:
+            mark_circuits_pending_upload(pending_hashes)
+            logger.debug("📤 Marked %d circuits as pending upload", len(pending_hashes))
+        
         # Coordinate session hashes from all workers
-        if worker_session_hashes:
-            coordinate_batch_session_hashes(worker_session_hashes)
-            # Update current session hashes for next batch
-            self.current_session_hashes = get_current_session_hashes()
-            logger.debug(f"🔄 Updated session hashes: {len(self.current_session_hashes)} total")
+        if new_session_hashes:
+            coordinate_batch_session_hashes([new_session_hashes])
+            if self._session_hash_log is not None and not self._session_hash_log.full:
+                self._session_hash_log.append(new_session_hashes)
+                if self._session_hash_log.full:
+                    logger.warning(
+                        f"⚠️  Session hash log full ({self._session_hash_log.capacity} hashes), "
+                        "sending session hashes with each task from now on"
+                    )
+            if self._session_hash_log_full():
+                # Update current session hashes for next batch
+                self.current_session_hashes = get_current_session_hashes()
+                logger.debug(f"🔄 Updated session hashes: {len(self.current_session_hashes)} total")
+    
+    def _session_hash_log_full(self) -> bool:
+        """True when new session hashes can no longer reach workers through the shared log."""
+        return self._session_hash_log is None or self._session_hash_log.full
     
     def _handle_azure_uploads(self) -> None:
-        """Handle Azure uploads when buffer reaches threshold."""
+        """Start a background Azure upload when the buffer reaches the threshold."""
+        self._reap_uploads()
         if self.azure_conn and should_trigger_upload(self.upload_buffer, self.azure_upload_interval):
             log_upload_trigger(len(self.upload_buffer), self.azure_upload_interval)
             
-            # Extract circuit hashes before upload
-            circuit_hashes = [result.get('circuit_hash') for result in self.upload_buffer if result.get('circuit_hash')]
-            
-            upload_stats = upload_batch_to_azure(self.upload_buffer, self.azure_conn)
-            self.stats['uploaded_to_azure'] += upload_stats['uploaded']
-            self.stats['upload_failures'] += upload_stats['failed']
+            # Don't let uploads fall arbitrarily far behind: with one upload
+            # already queued behind a running one, wait for the oldest
+            if len(self._pending_uploads) >= 2:
+                self._reap_uploads(wait_for=1)
             
-            # Update duplicate detector with upload results
-            if upload_stats.get('successful_hashes'):
-                mark_circuits_uploaded_to_azure(upload_stats['successful_hashes'])
-                logger.debug(f"☁️  Marked {len(upload_stats['successful_hashes'])} circuits as uploaded to Azure")
-            if upload_stats.get('failed_hashes'):
-                mark_circuits_upload_failed(upload_stats['failed_hashes'])
-                logger.debug(f"❌ Marked {len(upload_stats['failed_hashes'])} circuits as upload failed")
+            if self._upload_executor is None:
+                self._upload_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="azure-upload")
+            self._pending_uploads.append(
+                self._upload_executor.submit(upload_batch_to_azure, self.upload_buffer, self.azure_conn)
+            )
             
-            # Clear buffer
+            # Hand the buffer over and start a new one
             self.upload_buffer = []
             self.stats['last_azure_upload'] = self.stats['total_processed']
     
+    def _reap_uploads(self, wait_for: int = 0) -> None:
+        """
+        Apply the results of finished background uploads.
+        
+        Args:
+            wait_for: Number of the oldest pending uploads to block on
+                      (-1 waits for all of them)
+        """
+        still_pending = []
+        for index, future in enumerate(self._pending_uploads):
+            if wait_for < 0 or index < wait_for or future.done():
+                try:
+                    upload_stats = future.result()
+                except Exception as e:
+                    logger.warning(f"❌ Background Azure upload crashed: {e}")
+                    continue
+                self._apply_upload_stats(upload_stats)
+            else:
+                still_pending.append(future)
+        self._pending_uploads = still_pending
+    
+    def _apply_upload_stats(self, upload_stats: Dict[str, Any]) -> None:
+        """Record an upload batch in the statistics and the duplicate detector."""
+        self.stats['uploaded_to_azure'] += upload_stats['uploaded']
+        self.stats['upload_failures'] += upload_stats['failed']
+        
+        # Update duplicate detector with upload results
+        if upload_stats.get('successful_hashes'):
+            mark_circuits_uploaded_to_azure(upload_stats['successful_hashes'])
+            logger.debug(f"☁️  Marked {len(upload_stats['successful_hashes'])} circuits as uploaded to Azure")
+        if upload_stats.get('failed_hashes'):
+            mark_circuits_upload_failed(upload_stats['failed_hashes'])
+            logger.debug(f"❌ Marked {len(upload_stats['failed_hashes'])} circuits as upload failed")
+    
     def _handle_cleanup(self) -> None:
         """Handle periodic cleanup of old circuit files."""
         if should_cleanup(self.stats['total_processed']):
@@ -353,8 +486,12 @@ class PipelineManager:
         elapsed = time.time() - self.stats['start_time']
         rate = self.stats['total_processed'] / elapsed * 60 if elapsed > 0 else 0
         
-        # Monitor system resources
-        resources = monitor_system_resources()
+        # Monitor system resources, sampled at most every resource_sample_seconds
+        now = time.monotonic()
+        if now - self._last_resource_sample_time >= self.resource_sample_seconds:
+            self._last_resource_sample = monitor_system_resources()
+            self._last_resource_sample_time = now
+        resources = self._last_resource_sample
         
         # Enhanced status with Azure upload info
         azure_status = ""
@@ -372,22 +509,18 @@ class PipelineManager:
     
     def _finalize_pipeline(self) -> None:
         """Finalize pipeline execution with cleanup and final uploads."""
+        # Let background uploads finish before the last one
+        self._reap_uploads(wait_for=-1)
+        
         # Upload remaining circuits in buffer
         if self.azure_conn and self.upload_buffer:
             log_final_upload(len(self.upload_buffer))
-            
-            # Extract circuit hashes before upload
-            circuit_hashes = [result.get('circuit_hash') for result in self.upload_buffer if result.get('circuit_hash')]
-            
-            upload_stats = upload_batch_to_azure(self.upload_buffer, self.azure_conn)
-            self.stats['uploaded_to_azure'] += upload_stats['uploaded']
-            self.stats['upload_failures'] += upload_stats['failed']
-            
-            # Update duplicate detector with upload results
-            if upload_stats.get('successful_hashes'):
-                mark_circuits_uploaded_to_azure(upload_stats['successful_hashes'])
-            if upload_stats.get('failed_hashes'):
-                mark_circuits_upload_failed(upload_stats['failed_hashes'])
+            self._apply_upload_stats(upload_batch_to_azure(self.upload_buffer, self.azure_conn))
+            self.upload_buffer = []
+        
+        if self._upload_executor is not None:
+            self._upload_executor.shutdown(wait=True)
+            self._upload_executor = None
     
     def _get_final_stats(self) -> Dict[str, Any]:
         """
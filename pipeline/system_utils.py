@@ -13,12 +13,32 @@ import time
 import logging
 import psutil
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, Any
 
+from utils.local_index import index_exists, index_remove
+
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Free disk space moves slowly, but statvfs on a shared (Lustre/GPFS) filesystem
+# can be slow; re-query it at most this often
+DISK_USAGE_TTL_SECONDS = 30.0
+_disk_usage_cache = {'t': float('-inf'), 'val': None}
+
+# Deleting circuit directories is pure unlink() I/O that releases the GIL, so
+# a few threads keep several deletes in flight at once
+CLEANUP_THREADS = 8
+
+def _cached_disk_usage():
+    """psutil.disk_usage('.'), reused for DISK_USAGE_TTL_SECONDS."""
+    now = time.monotonic()
+    if now - _disk_usage_cache['t'] >= DISK_USAGE_TTL_SECONDS:
+        _disk_usage_cache['val'] = psutil.disk_usage('.')
+        _disk_usage_cache['t'] = now
+    return _disk_usage_cache['val']
+
 def monitor_system_resources() -> Dict[str, Any]:
     """
     Monitor system resources and return current usage.
@@ -26,9 +46,10 @@ def monitor_system_resources() -> Dict[str, Any]:
     Returns:
         Dictionary with system resource information
     """
-    cpu_percent = psutil.cpu_percent(interval=1)
+    # Non-blocking: usage since the previous call (primed in log_system_startup)
+    cpu_percent = psutil.cpu_percent(interval=None)
     memory = psutil.virtual_memory()
-    disk = psutil.disk_usage('.')
+    disk = _cached_disk_usage()
     
     return {
         'cpu_percent': cpu_percent,
@@ -37,10 +58,49 @@ def monitor_system_resources() -> Dict[str, Any]:
         'disk_free_gb': disk.free / (1024**3)
     }
 
+def throttle_on_memory_pressure(threshold_percent: float = 85.0) -> float:
+    """
+    Pause briefly if memory usage is above the threshold.
+    
+    The pause grows with the overshoot (50 ms per percent, at most 1 s), so
+    batches are only slowed down while the machine is actually under pressure.
+    
+    Args:
+        threshold_percent: Memory usage (percent) above which to pause
+        
+    Returns:
+        Seconds spent sleeping
+    """
+    memory_percent = psutil.virtual_memory().percent
+    if memory_percent <= threshold_percent:
+        return 0.0
+    delay = min(1.0, (memory_percent - threshold_percent) * 0.05)
+    time.sleep(delay)
+    return delay
+
+def _directory_size(path: str) -> int:
+    """Total size in bytes of the regular files below a directory."""
+    total = 0
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.is_file(follow_symlinks=False):
+                total += entry.stat(follow_symlinks=False).st_size
+            elif entry.is_dir(follow_symlinks=False):
+                total += _directory_size(entry.path)
+    return total
+
+def _remove_directory(path: str) -> int:
+    """Delete a circuit directory and return the bytes it held."""
+    dir_size = _directory_size(path)
+    shutil.rmtree(path)
+    return dir_size
+
 def cleanup_old_circuits(circuits_dir: Path, max_age_hours: int = 24) -> Dict[str, Any]:
     """
     Clean up old circuit files to free disk space.
     
+    Old directories are removed concurrently by up to CLEANUP_THREADS threads.
+    
     Args:
         circuits_dir: Directory containing circuit files
         max_age_hours: Maximum age in hours before deletion
@@ -55,23 +115,34 @@ def cleanup_old_circuits(circuits_dir: Path, max_age_hours: int = 24) -> Dict[st
     freed_bytes = 0
     cutoff_time = time.time() - (max_age_hours * 3600)
     
-    try:
-        for circuit_dir in circuits_dir.iterdir():
-            if circuit_dir.is_dir():
-                # Check if directory is old enough
-                dir_mtime = circuit_dir.stat().st_mtime
-                if dir_mtime < cutoff_time:
-                    # Calculate size before deletion
-                    dir_size = sum(f.stat().st_size for f in circuit_dir.rglob('*') if f.is_file())
-                    
-                    # Delete the directory
-                    shutil.rmtree(circuit_dir)
-                    
-                    deleted_count += 1
-                    freed_bytes += dir_size
+    has_index = index_exists(circuits_dir)
     
+    try:
+        # scandir entries carry cached stat results; no Path object per file
+        with os.scandir(circuits_dir) as entries:
+            old_dirs = [
+                (entry.name, entry.path)
+                for entry in entries
+                if entry.is_dir(follow_symlinks=False)
+                and entry.stat(follow_symlinks=False).st_mtime < cutoff_time
+            ]
     except Exception as e:
         logger.warning(f"Cleanup error: {e}")
+        return {'deleted': 0, 'freed_gb': 0}
+    
+    if old_dirs:
+        with ThreadPoolExecutor(max_workers=min(CLEANUP_THREADS, len(old_dirs))) as executor:
+            futures = [(name, executor.submit(_remove_directory, path)) for name, path in old_dirs]
+            for name, future in futures:
+                try:
+                    freed_bytes += future.result()
+                except Exception as e:
+                    logger.warning(f"Cleanup error: {e}")
+                    continue
+                # Index updates stay on this thread; sqlite connections are per thread
+                if has_index:
+                    index_remove(circuits_dir, name)
+                deleted_count += 1
     
     freed_gb = freed_bytes / (1024**3)
     return {'deleted': deleted_count, 'freed_gb': freed_gb}
@@ -85,11 +156,13 @@ def get_system_info() -> Dict[str, Any]:
     """
     import multiprocessing as mp
     
+    # One statvfs call serves both disk fields
+    disk = psutil.disk_usage('.')
     return {
         'cpu_count': mp.cpu_count(),
         'memory_total_gb': psutil.virtual_memory().total / (1024**3),
-        'disk_total_gb': psutil.disk_usage('.').total / (1024**3),
-        'disk_free_gb': psutil.disk_usage('.').free / (1024**3)
+        'disk_total_gb': disk.total / (1024**3),
+        'disk_free_gb': disk.free / (1024**3)
     }
 
 def log_system_startup(num_workers: int) -> None:
@@ -103,6 +176,9 @@ def log_system_startup(num_workers: int) -> None:
     
     logger.warning(f"🚀 Starting parallel pipeline with {num_workers} workers")
     logger.warning(f"System: {mp.cpu_count()} cores, {psutil.virtual_memory().total / (1024**3):.1f}GB RAM")
+    
+    # Prime the CPU counter so monitor_system_resources() never has to block
+    psutil.cpu_percent(interval=None)
 
 def should_cleanup(total_processed: int, cleanup_interval: int = 1000) -> bool:
     """
@@ -13,21 +13,29 @@ Each worker processes a single circuit through the complete pipeline:
 Author: InferQ Pipeline System
 """
 
+import os
 import logging
+import queue
 import sys
 import signal
-from datetime import datetime
+import psutil
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Set
+from typing import List, Set
 
 from generators.circuit_merger import CircuitMerger
 from generators.lib.generator import BaseParams
 from config import get_circuit_config, get_simulation_config, get_storage_config
-from utils.save_utils import save_circuit_locally
+from utils.save_utils import save_circuit_locally, circuit_file_path
+from utils.circuit_hash import compute_circuit_hash
 from feature_extractors.extractors import extract_features
 from simulators.simulate import QuantumSimulator
 from simulators.simulation_utils import process_simulation_data_for_features
-from utils.duplicate_detector import is_circuit_duplicate, initialize_duplicate_detection
+from utils.duplicate_detector import (
+    is_circuit_duplicate, initialize_duplicate_detection, get_duplicate_detector
+)
 
 def setup_worker_signal_handling():
     """Set up signal handling for worker processes."""
@@ -38,6 +46,209 @@ def setup_worker_signal_handling():
     signal.signal(signal.SIGINT, worker_signal_handler)
     signal.signal(signal.SIGTERM, worker_signal_handler)
 
+# Pipeline components built once per worker process and re-seeded per task
+_worker_components = {}
+
+# PID of the process whose duplicate detector has been initialized; the
+# parent's detector is inherited through fork() but must not count
+_duplicate_detection_pid = None
+
+# Hashes published by the manager (SharedHashLog) and how far this worker has read
+_session_hash_log = None
+_session_hash_log_position = 0
+
+
+def init_worker(core_queue=None, session_hash_log=None):
+    """
+    ProcessPoolExecutor initializer: set up signal handling, optionally pin the
+    process to a core, and build the per-process CircuitMerger and
+    QuantumSimulator up front.
+
+    Args:
+        core_queue: Optional queue of CPU core IDs; each worker takes one and
+                    pins itself to it
+        session_hash_log: Optional SharedHashLog the manager publishes new
+                          session hashes to
+    """
+    global _session_hash_log, _session_hash_log_position
+    _session_hash_log = session_hash_log
+    _session_hash_log_position = 0
+    setup_worker_signal_handling()
+    if core_queue is not None:
+        _pin_to_core(core_queue)
+    circuit_config = get_circuit_config()
+    simulation_config = get_simulation_config()
+    _get_worker_components(circuit_config['seed'], simulation_config['seed'])
+
+
+# Background thread for circuit serialization; created lazily in each worker
+# process (never in the parent, whose threads would not survive fork)
+_io_executor = None
+_io_executor_pid = None
+
+
+def _get_io_executor() -> ThreadPoolExecutor:
+    """Return this process's single-thread executor for serialization work."""
+    global _io_executor, _io_executor_pid
+    if _io_executor is None or _io_executor_pid != os.getpid():
+        _io_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="circuit-io")
+        _io_executor_pid = os.getpid()
+    return _io_executor
+
+
+# Features of recently seen circuit structures (see _extract_features_cached)
+_FEATURE_CACHE_SIZE = 4096
+_feature_cache = OrderedDict()
+
+# Features describing the circuit object rather than its structure; they are
+# refreshed from the circuit on every cache hit
+_IDENTITY_FEATURES = {
+    "name": lambda circuit: circuit.name,
+}
+
+
+def _structure_key(circuit) -> tuple:
+    """
+    Key a circuit by its structure: gate names and the bits they act on.
+
+    Feature extraction never looks at gate parameters, so circuits that only
+    differ in their angles share every extracted feature except the
+    per-circuit identity fields in _IDENTITY_FEATURES.
+    """
+    find_bit = circuit.find_bit
+    return (
+        circuit.num_qubits,
+        circuit.num_clbits,
+        tuple(
+            (
+                instruction.operation.name,
+                tuple(find_bit(qubit).index for qubit in instruction.qubits),
+                tuple(find_bit(clbit).index for clbit in instruction.clbits),
+            )
+            for instruction in circuit.data
+        ),
+    )
+
+
+def _extract_features_cached(circuit, precomputed: dict = None) -> dict:
+    """
+    extract_features() with a per-process LRU cache keyed by circuit structure.
+
+    Exact repeats are already skipped by duplicate detection; this catches
+    generators that re-emit the same structure with different parameters.
+    Callers get their own copy of the cached features.
+    """
+    key = _structure_key(circuit)
+    features = _feature_cache.get(key)
+    if features is not None:
+        _feature_cache.move_to_end(key)
+        features = dict(features)
+        for field, read in _IDENTITY_FEATURES.items():
+            if field in features:
+                features[field] = read(circuit)
+        return features
+
+    features = extract_features(circuit=circuit, precomputed=precomputed)
+    _feature_cache[key] = dict(features)
+    if len(_feature_cache) > _FEATURE_CACHE_SIZE:
+        _feature_cache.popitem(last=False)
+    return features
+
+
+def _pin_to_core(core_queue) -> None:
+    """Pin this process to the next free core from the queue, if any is left."""
+    try:
+        core = core_queue.get_nowait()
+    except queue.Empty:
+        # Replacement workers after a crash run unpinned
+        return
+    try:
+        psutil.Process().cpu_affinity([core])
+    except (AttributeError, psutil.Error, OSError):
+        # cpu_affinity is not available on macOS
+        pass
+
+
+def warm_up_worker_components():
+    """
+    Build the pipeline components and generate one circuit in the current process.
+
+    Called in the parent before forking the worker pool: the children inherit
+    the loaded modules, Qiskit's lazily filled registries and the built
+    components copy-on-write instead of recreating them on startup.
+    """
+    circuit_config = get_circuit_config()
+    simulation_config = get_simulation_config()
+    circuit_merger, _ = _get_worker_components(circuit_config['seed'], simulation_config['seed'])
+    circuit_merger.generate_hierarchical_circuit(
+        stopping_probability=circuit_config['stopping_probability'],
+        max_generators=circuit_config['max_generators']
+    )
+
+
+def _get_worker_components(seed: int, sim_seed: int):
+    """
+    Return this process's CircuitMerger and QuantumSimulator, seeded for one task.
+
+    Building both pulls in every generator and one AerSimulator per method, so
+    they are created on first use and only re-seeded afterwards.
+
+    Args:
+        seed: Circuit generation seed for this task
+        sim_seed: Simulation seed for this task
+
+    Returns:
+        Tuple of (circuit_merger, quantum_simulator)
+    """
+    if not _worker_components:
+        circuit_config = get_circuit_config()
+        simulation_config = get_simulation_config()
+        base_params = BaseParams(
+            max_qubits=circuit_config['max_qubits'], 
+            min_qubits=circuit_config['min_qubits'], 
+            max_depth=circuit_config['max_depth'], 
+            min_depth=circuit_config['min_depth'], 
+            seed=seed, 
+            measure=circuit_config['measure']
+        )
+        _worker_components['circuit_merger'] = CircuitMerger(base_params=base_params)
+        # The pool already runs one simulation per core; Aer's own OpenMP
+        # threads on top of that would only oversubscribe the machine
+        _worker_components['quantum_simulator'] = QuantumSimulator(
+            seed=sim_seed,
+            shots=simulation_config['shots'],
+            timeout_seconds=simulation_config['timeout_seconds'],
+            max_parallel_threads=1
+        )
+    else:
+        _worker_components['circuit_merger'].reseed(seed)
+        _worker_components['quantum_simulator'].reseed(sim_seed)
+    return _worker_components['circuit_merger'], _worker_components['quantum_simulator']
+
+def _ensure_duplicate_detection() -> None:
+    """
+    Initialize duplicate detection once per worker process.
+    
+    Later tasks only pick up the hash cache again when the manager has
+    rewritten it, instead of reloading it (and, without a cache, re-fetching
+    every hash from Azure) for every circuit.
+    """
+    global _duplicate_detection_pid
+    if _duplicate_detection_pid != os.getpid():
+        initialize_duplicate_detection()
+        _duplicate_detection_pid = os.getpid()
+    else:
+        get_duplicate_detector().refresh_from_cache()
+
+def _sync_session_hash_log() -> None:
+    """Add the hashes the manager published since the last task to the detector."""
+    global _session_hash_log_position
+    if _session_hash_log is None:
+        return
+    new_hashes, _session_hash_log_position = _session_hash_log.read_from(_session_hash_log_position)
+    if new_hashes:
+        get_duplicate_detector().add_session_hashes(new_hashes)
+
 def run_single_pipeline(worker_id: int, seed_offset: int, existing_session_hashes: Set[str] = None) -> dict:
     """
     Run a single pipeline iteration optimized for performance.
@@ -52,31 +263,17 @@ def run_single_pipeline(worker_id: int, seed_offset: int, existing_session_hashe
     try:
         # Configure worker-specific logging
         worker_logger = _setup_worker_logging(worker_id)
-        worker_logger.info(f"Starting pipeline iteration (seed_offset={seed_offset})")
+        worker_logger.info("Starting pipeline iteration (seed_offset=%s)", seed_offset)
         
         # Get circuit, simulation, and storage configuration from centralized config
         circuit_config = get_circuit_config()
         simulation_config = get_simulation_config()
         storage_config = get_storage_config()
         seed=circuit_config['seed'] + seed_offset + worker_id * 1000
-        # Initialize components using centralized configuration
-        base_params = BaseParams(
-            max_qubits=circuit_config['max_qubits'], 
-            min_qubits=circuit_config['min_qubits'], 
-            max_depth=circuit_config['max_depth'], 
-            min_depth=circuit_config['min_depth'], 
-            seed=seed, 
-            measure=circuit_config['measure']
-        )
         # Calculate simulation seed
         sim_seed = simulation_config['seed'] + seed_offset + worker_id * 1000
-        worker_logger.debug(f"Initializing components with circuit seed {seed}, simulation seed {sim_seed}")
-        circuit_merger = CircuitMerger(base_params=base_params)
-        quantum_simulator = QuantumSimulator(
-            seed=sim_seed,
-            shots=simulation_config['shots'],
-            timeout_seconds=simulation_config['timeout_seconds']
-        )
+        worker_logger.debug("Seeding components with circuit seed %s, simulation seed %s", seed, sim_seed)
+        circuit_merger, quantum_simulator = _get_worker_components(seed, sim_seed)
         
         # Step 1: Generate circuit
         worker_logger.debug("Step 1: Generating circuit...")
@@ -84,40 +281,50 @@ def run_single_pipeline(worker_id: int, seed_offset: int, existing_session_hashe
             stopping_probability=circuit_config['stopping_probability'],
             max_generators=circuit_config['max_generators']
         )
-        worker_logger.info(f"Generated circuit: {circuit.num_qubits} qubits, depth {circuit.depth()}, size {circuit.size()}")
-        if(circuit.size()>circuit_config["max_circuit_size"]):
+        # depth() and size() each walk the circuit; compute them once and reuse
+        circuit_depth, circuit_size = circuit.depth(), circuit.size()
+        worker_logger.info("Generated circuit: %d qubits, depth %d, size %d", circuit.num_qubits, circuit_depth, circuit_size)
+        if(circuit_size>circuit_config["max_circuit_size"]):
             return _create_error_result(worker_id, Exception("Circuit too complex..."))
         # Step 2: Check for duplicates BEFORE expensive operations
         worker_logger.debug("Step 2: Checking for duplicates...")
         
         # Initialize duplicate detection in worker process (loads from cache)
-        initialize_duplicate_detection()
+        _ensure_duplicate_detection()
         
-        # Add existing session hashes from other workers
+        # Add session hashes from other workers: normally read from the shared
+        # log, passed in only when the manager could not publish them there
+        _sync_session_hash_log()
         if existing_session_hashes:
-            from utils.duplicate_detector import get_duplicate_detector
             detector = get_duplicate_detector()
             detector.add_session_hashes(existing_session_hashes)
-            worker_logger.debug(f"Worker loaded {len(existing_session_hashes)} existing session hashes")
+            worker_logger.debug("Worker loaded %d existing session hashes", len(existing_session_hashes))
         
         is_duplicate, circuit_hash = is_circuit_duplicate(circuit)
         
         if is_duplicate:
-            worker_logger.info(f"🔍 DUPLICATE DETECTED: Circuit {circuit_hash[:8]}... already exists - skipping expensive operations")
-            return _create_duplicate_result(worker_id, circuit, circuit_hash)
+            worker_logger.info("🔍 DUPLICATE DETECTED: Circuit %.8s... already exists - skipping expensive operations", circuit_hash)
+            return _create_duplicate_result(worker_id, circuit, circuit_hash, circuit_depth, circuit_size)
+        
+        worker_logger.info("🆕 NEW CIRCUIT: %.8s... - proceeding with full processing", circuit_hash)
         
-        worker_logger.info(f"🆕 NEW CIRCUIT: {circuit_hash[:8]}... - proceeding with full processing")
+        # Serialize the circuit for the local save in the background; Aer
+        # releases the GIL while simulating, so this overlaps with step 4
+        serialize_future = _get_io_executor().submit(compute_circuit_hash, circuit)
         
         # Step 3: Extract features (only for new circuits)
         worker_logger.debug("Step 3: Extracting features...")
-        features = extract_features(circuit=circuit)
-        worker_logger.debug(f"Extracted {len(features)} features")
+        features = _extract_features_cached(
+            circuit,
+            precomputed={"num_qubits": circuit.num_qubits, "depth": circuit_depth, "size": circuit_size}
+        )
+        worker_logger.debug("Extracted %d features", len(features))
         
         # Step 4: Run simulations (only for new circuits)
         worker_logger.debug("Step 4: Running simulations...")
         simulation_results = quantum_simulator.simulate_all_methods(circuit)
         successful_sims = sum(1 for r in simulation_results.values() if r.get('success', False))
-        worker_logger.info(f"Simulations completed: {successful_sims}/{len(simulation_results)} successful")
+        worker_logger.info("Simulations completed: %d/%d successful", successful_sims, len(simulation_results))
         
         # Step 5: Process simulation data
         worker_logger.debug("Step 5: Processing simulation data...")
@@ -129,17 +336,46 @@ def run_single_pipeline(worker_id: int, seed_offset: int, existing_session_hashe
         storage_path.mkdir(parents=True, exist_ok=True)
         
         saved_hash, saved_features, written = save_circuit_locally(
-            circuit, combined_features, storage_path, expected_hash=circuit_hash
+            circuit, combined_features, storage_path, expected_hash=circuit_hash,
+            serialized=serialize_future.result()
         )
-        worker_logger.info(f"Circuit saved: hash={saved_hash[:8]}..., written={written}")
+        worker_logger.info("Circuit saved: hash=%.8s..., written=%s", saved_hash, written)
         
         # Use the original circuit_hash (computed once) for consistency
+        # Hand the parent the saved file instead of the circuit object, so the
+        # circuit is not pickled back through the pool and serialized again
+        circuit_path = None
+        if written:
+            saved_file = circuit_file_path(
+                storage_path / saved_hash, saved_features.get('serialization_method', 'qpy')
+            )
+            # Fallback methods leave no circuit file to upload
+            circuit_path = str(saved_file) if saved_file else None
         return _create_success_result(worker_id, circuit, circuit_hash, 
-                                    combined_features, saved_features, written)
+                                    combined_features, saved_features, written,
+                                    circuit_depth, circuit_size, circuit_path)
         
     except Exception as e:
         return _create_error_result(worker_id, e)
 
+def run_pipeline_chunk(worker_ids: List[int], seed_offsets: List[int],
+                       existing_session_hashes: Set[str] = None) -> List[dict]:
+    """
+    Run several pipeline iterations in one task.
+    
+    Args:
+        worker_ids: Worker ID for each iteration
+        seed_offsets: Seed offset for each iteration
+        existing_session_hashes: Session hashes shared by every iteration
+        
+    Returns:
+        One run_single_pipeline() result per iteration, in order
+    """
+    return [
+        run_single_pipeline(worker_id, seed_offset, existing_session_hashes)
+        for worker_id, seed_offset in zip(worker_ids, seed_offsets)
+    ]
+
 def _setup_worker_logging(worker_id: int) -> logging.Logger:
     """
     Set up worker-specific logging.
@@ -166,57 +402,50 @@ def _setup_worker_logging(worker_id: int) -> logging.Logger:
     
     return worker_logger
 
-def _create_duplicate_result(worker_id: int, circuit, circuit_hash: str) -> dict:
+def _create_duplicate_result(worker_id: int, circuit, circuit_hash: str,
+                             circuit_depth: int = None, circuit_size: int = None) -> dict:
     """Create result dictionary for duplicate circuits."""
-    # Get worker's session hashes for batch coordination
-    from utils.duplicate_detector import get_duplicate_detector
-    detector = get_duplicate_detector()
-    worker_session_hashes = detector.get_session_hashes()
-    
     return {
         'success': True,
         'worker_id': worker_id,
         'circuit_hash': circuit_hash,
         'circuit_qubits': circuit.num_qubits,
-        'circuit_depth': circuit.depth(),
-        'circuit_size': circuit.size(),
+        'circuit_depth': circuit.depth() if circuit_depth is None else circuit_depth,
+        'circuit_size': circuit.size() if circuit_size is None else circuit_size,
         'features_count': 0,
         'written': False,  # Not written because it's a duplicate
         'duplicate': True,
-        'timestamp': datetime.now().isoformat(),
+        'timestamp': time.time(),
         # No circuit data for upload since it's a duplicate
-        'circuit': None,
+        'circuit_path': None,
         'features': {},
-        'serialization_method': None,
-        # Include session hashes for batch coordination
-        'worker_session_hashes': worker_session_hashes
+        # A duplicate adds nothing to the session
+        'worker_session_hashes': set()
     }
 
 def _create_success_result(worker_id: int, circuit, circuit_hash: str,
-                          combined_features: dict, saved_features: dict, written: bool) -> dict:
+                          combined_features: dict, saved_features: dict, written: bool,
+                          circuit_depth: int = None, circuit_size: int = None,
+                          circuit_path: str = None) -> dict:
     """Create result dictionary for successful processing."""
-    # Get worker's session hashes for batch coordination
-    from utils.duplicate_detector import get_duplicate_detector
-    detector = get_duplicate_detector()
-    worker_session_hashes = detector.get_session_hashes()
-    
     return {
         'success': True,
         'worker_id': worker_id,
         'circuit_hash': circuit_hash,  # Use the original hash computed once
         'circuit_qubits': circuit.num_qubits,
-        'circuit_depth': circuit.depth(),
-        'circuit_size': circuit.size(),
+        'circuit_depth': circuit.depth() if circuit_depth is None else circuit_depth,
+        'circuit_size': circuit.size() if circuit_size is None else circuit_size,
         'features_count': len(combined_features),
         'written': written,
         'duplicate': False,
-        'timestamp': datetime.now().isoformat(),
+        'timestamp': time.time(),
         # Include data for remote upload
-        'circuit': circuit,
+        'circuit_path': circuit_path,
         'features': saved_features,
-        'serialization_method': saved_features.get('serialization_method', 'qpy'),
-        # Include session hashes for batch coordination
-        'worker_session_hashes': worker_session_hashes
+        # Only the hash this iteration added: the parent unions the batch
+        # results, so shipping the worker's whole (ever-growing) session set
+        # back through the pipe on every result is redundant
+        'worker_session_hashes': {circuit_hash}
     }
 
 def _create_error_result(worker_id: int, error: Exception) -> dict:
@@ -233,5 +462,5 @@ def _create_error_result(worker_id: int, error: Exception) -> dict:
         'success': False,
         'worker_id': worker_id,
         'error': str(error),
-        'timestamp': datetime.now().isoformat()
+        'timestamp': time.time()
     }
\ No newline at end of file
@@ -8,6 +8,7 @@ import logging
 from datetime import datetime
 from tqdm import tqdm
 from utils.azure_connection import AzureConnection
+from utils.table_storage import get_circuit_entity
 
 # Setup logging
 logging.basicConfig(
@@ -61,7 +62,10 @@ def fetch_circuit_by_id(circuit_id):
         table_client = azure_conn.get_circuits_table_client()
 
         logger.info(f"Fetching circuit with ID: {circuit_id}")
-        entity = table_client.get_entity(partition_key="circuits", row_key=circuit_id)
+        entity = get_circuit_entity(table_client, circuit_id)
+        if entity is None:
+            logger.error(f"Circuit {circuit_id} not found")
+            return None
 
         print(json.dumps(dict(entity), indent=4, default=str))
         return entity
@@ -95,10 +99,8 @@ def fetch_data():
 
         logger.info(f"Querying Azure Table 'circuits' with page size {PAGE_SIZE}...")
 
-        # query_entities returns an ItemPaged object
-        query = table_client.query_entities(
-            query_filter="PartitionKey eq 'circuits'", results_per_page=PAGE_SIZE
-        )
+        # list_entities returns an ItemPaged object spanning every hash partition
+        query = table_client.list_entities(results_per_page=PAGE_SIZE)
 
         # Get iterator with continuation token if available
         pages = query.by_page(continuation_token=continuation_token)
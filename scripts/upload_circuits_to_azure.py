@@ -7,6 +7,7 @@ then uploads both to Azure services:
 - Circuit metadata → Azure Table Storage
 """
 
+import os
 import json
 import logging
 import sys
@@ -19,6 +20,7 @@ from tqdm import tqdm
 from utils.azure_connection import AzureConnection
 from utils.blob_storage import upload_circuit_blob
 from utils.table_storage import save_circuit_metadata_to_table
+from utils.local_index import index_exists, index_remove
 from config import get_storage_config
 
 # Configure logging
@@ -72,19 +74,21 @@ def discover_circuits(circuits_dir: Path):
         logger.error(f"Circuits directory not found: {circuits_dir}")
         return circuit_dirs
     
-    # Iterate through all subdirectories (circuit hash directories)
-    for item in circuits_dir.iterdir():
-        if item.is_dir() and not item.name.startswith('.'):
+    # Iterate through all subdirectories (circuit hash directories); scandir
+    # yields cached d_type info, so is_dir() needs no extra stat() and no
+    # Path object is built for entries that are skipped
+    with os.scandir(circuits_dir) as entries:
+        for entry in entries:
+            if not entry.is_dir(follow_symlinks=False) or entry.name.startswith('.'):
+                continue
             # Check if it contains the required files
-            qpy_file = item / "circuit.qpy"
-            meta_file = item / "meta.json"
-            
-            if qpy_file.exists() and meta_file.exists():
-                circuit_id = item.name
-                circuit_dirs.append((item, circuit_id))
+            if (os.path.exists(os.path.join(entry.path, "circuit.qpy"))
+                    and os.path.exists(os.path.join(entry.path, "meta.json"))):
+                circuit_id = entry.name
+                circuit_dirs.append((circuits_dir / circuit_id, circuit_id))
                 logger.debug(f"Found circuit: {circuit_id}")
             else:
-                logger.warning(f"Skipping incomplete circuit directory: {item.name}")
+                logger.warning(f"Skipping incomplete circuit directory: {entry.name}")
     
     logger.info(f"Discovered {len(circuit_dirs)} circuits")
     return circuit_dirs
@@ -155,6 +159,8 @@ def upload_circuit(circuit_dir: Path, circuit_id: str, azure_conn: AzureConnecti
             if delete_after_upload and not dry_run:
                 try:
                     shutil.rmtree(circuit_dir)
+                    if index_exists(circuit_dir.parent):
+                        index_remove(circuit_dir.parent, circuit_id)
                     logger.info(f"🗑️  Deleted local folder: {circuit_dir.name}")
                 except Exception as e:
                     logger.warning(f"⚠ Failed to delete local folder {circuit_dir.name}: {e}")
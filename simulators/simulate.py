@@ -212,6 +212,7 @@ class QuantumSimulator:
         seed: Optional[int] = None,
         timeout_seconds: Optional[int] = None,
         device: str = "CPU",
+        max_parallel_threads: int = 0,
     ):
         """
         Initialize the quantum simulator.
@@ -221,11 +222,13 @@ class QuantumSimulator:
             seed: Random seed for reproducible results
             timeout_seconds: Maximum time allowed for simulation (in seconds)
             device: Device to run simulations on ("CPU" or "GPU")
+            max_parallel_threads: Aer OpenMP threads per simulation (0 = all cores)
         """
         self.shots = shots
         self.seed = seed
         self.timeout_seconds = timeout_seconds
         self.device = device
+        self.max_parallel_threads = max_parallel_threads
         self.simulators = {}
         self._initialize_simulators()
 
@@ -254,6 +257,7 @@ class QuantumSimulator:
                     shots=self.shots,
                     seed_simulator=self.seed,
                     device=method_device,
+                    max_parallel_threads=self.max_parallel_threads,
                 )
                 logger.info(
                     f"Initialized simulator for method {method.value} on device {method_device}"
@@ -269,6 +273,18 @@ class QuantumSimulator:
             logger.error(f"Error initializing simulators: {e}")
             raise
 
+    def reseed(self, seed: Optional[int]) -> None:
+        """
+        Change the simulation seed while keeping the initialized simulators.
+
+        Args:
+            seed: New random seed for all simulators
+        """
+        self.seed = seed
+        for simulator in self.simulators.values():
+            if isinstance(simulator, AerSimulator):
+                simulator.set_options(seed_simulator=seed)
+
     def simulate_statevector(self, qc: QuantumCircuit, **kwargs) -> Dict[str, Any]:
         """
         Simulate using the statevector method.
@@ -375,9 +391,15 @@ class QuantumSimulator:
         Returns:
             Dictionary mapping method names to their simulation results
         """
-        logger.info(
-            f"Starting simulation for circuit: {qc.num_qubits} qubits, depth {qc.depth()}, size {qc.size()}"
-        )
+        # size() and depth() walk the whole circuit; compute each once
+        circuit_size = qc.size()
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Starting simulation for circuit: %d qubits, depth %d, size %d",
+                qc.num_qubits,
+                qc.depth(),
+                circuit_size,
+            )
         results = {}
         successful_methods = 0
         failed_methods = 0
@@ -392,14 +414,14 @@ class QuantumSimulator:
         max_circuit_size = sim_config.get("max_circuit_size", 1000)
 
         # Check overall circuit complexity
-        if qc.size() > max_circuit_size:
+        if circuit_size > max_circuit_size:
             logger.warning(
-                f"Circuit too complex for simulation: {qc.size()} gates > {max_circuit_size} limit"
+                f"Circuit too complex for simulation: {circuit_size} gates > {max_circuit_size} limit"
             )
             # Return failed results for all methods
             failed_result = {
                 "success": False,
-                "error": f"Circuit too complex: {qc.size()} gates exceeds simulation limit of {max_circuit_size}",
+                "error": f"Circuit too complex: {circuit_size} gates exceeds simulation limit of {max_circuit_size}",
                 "skipped": True,
             }
             return {
@@ -536,8 +558,10 @@ class QuantumSimulator:
             # Transpile circuit for the specific simulator
             logger.debug(f"Transpiling circuit for {method.value}...")
             transpiled_qc = transpile(circuit_to_simulate, simulator)
+            transpiled_depth = transpiled_qc.depth()
+            transpiled_size = transpiled_qc.size()
             logger.debug(
-                f"✓ Circuit transpiled: depth {transpiled_qc.depth()}, size {transpiled_qc.size()}"
+                "✓ Circuit transpiled: depth %d, size %d", transpiled_depth, transpiled_size
             )
 
             # Run the simulation with timing and timeout handling
@@ -631,8 +655,8 @@ class QuantumSimulator:
                 "execution_time": execution_time,
                 "memory_usage": memory_usage,
                 # Transpiled circuit stats
-                "transpiled_circuit_depth": transpiled_qc.depth(),
-                "transpiled_circuit_size": transpiled_qc.size(),
+                "transpiled_circuit_depth": transpiled_depth,
+                "transpiled_circuit_size": transpiled_size,
                 "transpiled_num_qubits": transpiled_qc.num_qubits,
                 "transpiled_num_clbits": transpiled_qc.num_clbits,
                 "transpiled_gate_counts": gate_counts,
@@ -0,0 +1,33 @@
+import unittest
+import sys
+import os
+
+# Ensure project root is in path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
+
+from generators.lib.batch import generate_batch, _generate_one
+from generators.lib.generator import BaseParams
+from generators.state_prep_circuits.ghz import GHZ
+from generators.state_prep_circuits.two_local_rand import TwoLocal
+
+
+class TestGenerateBatch(unittest.TestCase):
+
+    def setUp(self):
+        self.params_list = [
+            BaseParams(max_qubits=6, min_qubits=2, max_depth=3, min_depth=1, seed=seed)
+            for seed in range(6)
+        ]
+
+    def test_matches_serial_generation(self):
+        for gen_cls in (GHZ, TwoLocal):
+            expected = [_generate_one((gen_cls, p)) for p in self.params_list]
+            circuits = generate_batch(gen_cls, self.params_list, max_workers=2)
+            self.assertEqual(circuits, expected)
+
+    def test_empty_grid(self):
+        self.assertEqual(generate_batch(GHZ, []), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
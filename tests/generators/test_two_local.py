@@ -0,0 +1,36 @@
+import unittest
+import sys
+import os
+
+# Ensure project root is in path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
+
+from qiskit.circuit.library import TwoLocal as QiskitTwoLocal
+
+from generators.lib.generator import BaseParams
+from generators.state_prep_circuits.two_local_rand import TwoLocal
+
+
+class TestTwoLocalEntanglement(unittest.TestCase):
+
+    def setUp(self):
+        params = BaseParams(max_qubits=3, min_qubits=3, max_depth=3, min_depth=1, seed=0)
+        self.generator = TwoLocal(params)
+
+    def test_explicit_pairs(self):
+        entanglement = [[0, 1], [1, 2]]
+        values = [0.1 * i for i in range(6)]
+        circuit = self.generator.generate(3, 1, values, ["ry"], ["cx"], entanglement)
+
+        expected = QiskitTwoLocal(
+            3, ["ry"], ["cx"], entanglement=entanglement, reps=1
+        ).decompose().assign_parameters(values)
+        self.assertEqual(circuit, expected)
+        # Served from the cache the second time
+        self.assertEqual(
+            self.generator.generate(3, 1, values, ["ry"], ["cx"], entanglement), circuit
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,82 @@
+import unittest
+import sys
+import os
+from types import SimpleNamespace
+
+# Ensure project root is in path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../')))
+
+from qiskit import QuantumCircuit
+
+from utils.blob_storage import ZSTD_AVAILABLE, upload_circuit_blob, download_circuit_blob
+
+
+class _FakeBlobClient:
+    """In-memory blob that behaves like the HTTP client on download."""
+
+    def __init__(self, name):
+        self.url = f"https://example.invalid/circuits/{name}"
+        self.data = None
+        self.metadata = None
+        self.content_settings = None
+
+    def upload_blob(self, data, overwrite=False, content_settings=None, metadata=None, **kwargs):
+        self.data = bytes(data)
+        self.content_settings = content_settings
+        self.metadata = dict(metadata or {})
+
+    def download_blob(self, decompress=True, **kwargs):
+        data = self.data
+        # urllib3 decodes a Content-Encoding header on its own unless told not to
+        if decompress and self.content_settings.content_encoding == "zstd":
+            import zstandard
+            data = zstandard.ZstdDecompressor().decompress(data)
+        return SimpleNamespace(
+            readall=lambda: data,
+            properties=SimpleNamespace(metadata=self.metadata),
+        )
+
+
+class _FakeContainerClient:
+
+    def __init__(self):
+        self.blobs = {}
+
+    def get_blob_client(self, name):
+        return self.blobs.setdefault(name, _FakeBlobClient(name))
+
+
+def _circuit():
+    qc = QuantumCircuit(3)
+    qc.h(0)
+    qc.cx(0, 1)
+    qc.rz(0.5, 2)
+    return qc
+
+
+class TestBlobRoundTrip(unittest.TestCase):
+
+    def _round_trip(self, compress):
+        container = _FakeContainerClient()
+        qc = _circuit()
+        circuit_hash = "ab" + "0" * 62
+        upload_circuit_blob(container, qc, circuit_hash, compress=compress)
+
+        blob_path = f"ab/{circuit_hash}.qpy"
+        blob = container.blobs[blob_path]
+        self.assertIsNone(blob.content_settings.content_encoding)
+        self.assertEqual(download_circuit_blob(container, blob_path), qc)
+        return blob
+
+    def test_uncompressed(self):
+        blob = self._round_trip(compress=False)
+        self.assertNotIn("encoding", blob.metadata)
+
+    @unittest.skipUnless(ZSTD_AVAILABLE, "zstandard not installed")
+    def test_compressed(self):
+        blob = self._round_trip(compress=True)
+        self.assertEqual(blob.metadata["encoding"], "zstd")
+
+
+if __name__ == '__main__':
+    unittest.main()
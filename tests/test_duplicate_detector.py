@@ -0,0 +1,83 @@
+import unittest
+import sys
+import os
+import tempfile
+import hashlib
+from pathlib import Path
+
+# Ensure project root is in path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../')))
+
+from utils.duplicate_detector import DuplicateDetector, SharedHashLog
+
+
+def _hash(i):
+    return hashlib.sha256(str(i).encode()).hexdigest()
+
+
+class TestRefreshFromCache(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.cache_file = Path(self.tmp.name) / "hashes.json"
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_merges_only_when_file_changed(self):
+        writer = DuplicateDetector(cache_file=self.cache_file)
+        writer.azure_hashes = {"a"}
+        writer._save_cache()
+
+        reader = DuplicateDetector(cache_file=self.cache_file)
+        self.assertTrue(reader._load_cache())
+        reader.session_hashes.add("own")
+        self.assertFalse(reader.refresh_from_cache())
+
+        writer.pending_hashes.add("b")
+        writer._save_cache()
+        # Force a distinct mtime on filesystems with coarse timestamps
+        os.utime(self.cache_file, ns=(0, reader._cache_mtime_ns + 1))
+        self.assertTrue(reader.refresh_from_cache())
+        self.assertEqual(reader.known_hashes, {"a", "b", "own"})
+        self.assertFalse(reader.refresh_from_cache())
+
+    def test_missing_cache_file(self):
+        detector = DuplicateDetector(cache_file=self.cache_file)
+        self.assertFalse(detector.refresh_from_cache())
+
+
+class TestIsKnown(unittest.TestCase):
+
+    def test_checks_every_state(self):
+        detector = DuplicateDetector(cache_file=Path(tempfile.gettempdir()) / "unused.json")
+        detector.azure_hashes = {"a"}
+        detector.pending_hashes = {"b"}
+        detector.session_hashes = {"c"}
+        for circuit_hash in "abc":
+            self.assertTrue(detector.is_known(circuit_hash))
+        self.assertFalse(detector.is_known("d"))
+
+
+class TestSharedHashLog(unittest.TestCase):
+
+    def test_incremental_reads(self):
+        log = SharedHashLog(4)
+        self.assertEqual(log.append([_hash(0), _hash(1), "not-a-hash"]), 2)
+        hashes, position = log.read_from(0)
+        self.assertEqual(hashes, [_hash(0), _hash(1)])
+        self.assertEqual(log.read_from(position), ([], position))
+
+        log.append([_hash(2)])
+        self.assertEqual(log.read_from(position), ([_hash(2)], 3))
+
+    def test_stops_at_capacity(self):
+        log = SharedHashLog(2)
+        self.assertEqual(log.append(_hash(i) for i in range(3)), 2)
+        self.assertTrue(log.full)
+        self.assertEqual(log.append([_hash(3)]), 0)
+        self.assertEqual(log.read_from(0)[0], [_hash(0), _hash(1)])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,36 @@
+import unittest
+import sys
+import os
+
+# Ensure project root is in path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../')))
+
+from qiskit import QuantumCircuit
+
+from pipeline.worker import _extract_features_cached
+
+
+def _circuit(name, angle):
+    qc = QuantumCircuit(2, name=name)
+    qc.ry(angle, 0)
+    qc.ry(angle, 1)
+    qc.cx(0, 1)
+    return qc
+
+
+class TestFeatureCache(unittest.TestCase):
+
+    def test_same_structure_keeps_own_name(self):
+        first = _extract_features_cached(_circuit("RealAmplitudes", 0.1))
+        second = _extract_features_cached(_circuit("TwoLocal", 0.2))
+
+        self.assertEqual(first["name"], "RealAmplitudes")
+        self.assertEqual(second["name"], "TwoLocal")
+        self.assertEqual(
+            {k: v for k, v in first.items() if k != "name"},
+            {k: v for k, v in second.items() if k != "name"},
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
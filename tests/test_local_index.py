@@ -0,0 +1,63 @@
+import unittest
+import sys
+import os
+import json
+import tempfile
+from pathlib import Path
+
+# Ensure project root is in path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../')))
+
+from utils.local_index import (
+    index_count,
+    index_diff,
+    index_exists,
+    index_insert,
+    index_remove,
+)
+
+
+class TestLocalIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp.name)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_insert_count_remove(self):
+        self.assertFalse(index_exists(self.root))
+        meta = {"circuit_qubits": 3, "circuit_depth": 4, "circuit_size": 5}
+        index_insert(self.root, "a", meta)
+        index_insert(self.root, "b", meta)
+        index_insert(self.root, "a", meta)
+        self.assertTrue(index_exists(self.root))
+        self.assertEqual(index_count(self.root), 2)
+
+        index_remove(self.root, "a")
+        self.assertEqual(index_count(self.root), 1)
+
+    def test_diff_against_streamed_hashes(self):
+        for h in ("a", "b", "c"):
+            index_insert(self.root, h, {})
+        local_only, azure_only = index_diff(self.root, iter(["b", "c", "d", "d"]))
+        self.assertEqual(local_only, ["a"])
+        self.assertEqual(azure_only, ["d"])
+
+        # The temporary table does not leak into the next comparison
+        self.assertEqual(index_diff(self.root, []), (["a", "b", "c"], []))
+
+    def test_backfills_existing_directories(self):
+        for h in ("old1", "old2", "partial"):
+            (self.root / h).mkdir()
+        for h in ("old1", "old2"):
+            (self.root / h / "meta.json").write_text(json.dumps({"circuit_qubits": 2}))
+
+        index_insert(self.root, "new", {})
+        self.assertEqual(index_count(self.root), 3)
+        self.assertEqual(index_diff(self.root, ["old1", "old2", "new"]), ([], []))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,37 @@
+import unittest
+import sys
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+# Ensure project root is in path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../')))
+
+from pipeline.manager import PipelineManager
+
+
+class TestProcessBatchTimeout(unittest.TestCase):
+
+    def test_completed_chunks_survive_a_timeout(self):
+        release = threading.Event()
+
+        def fake_chunk(worker_ids, seed_offsets, session_hashes):
+            if seed_offsets[0] == 0:
+                # The first chunk hangs past the batch timeout
+                release.wait(5)
+            return [{'success': True, 'seed_offset': offset} for offset in seed_offsets]
+
+        manager = PipelineManager(num_workers=2, batch_timeout_seconds=0.5)
+        with ThreadPoolExecutor(max_workers=3) as executor, \
+                mock.patch('pipeline.manager.run_pipeline_chunk', fake_chunk):
+            results = manager._process_batch(executor, batch_size=6, iteration=0)
+            release.set()
+
+        completed = [r['seed_offset'] for r in results if r['success']]
+        self.assertEqual(completed, [3, 4, 5])
+        self.assertEqual(sum(1 for r in results if r.get('timeout')), 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
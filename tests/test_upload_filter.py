@@ -0,0 +1,41 @@
+import unittest
+import sys
+import os
+import hashlib
+import tempfile
+from pathlib import Path
+
+# Ensure project root is in path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../')))
+
+from utils.upload_filter import UploadedHashFilter, load_upload_filter
+
+
+def _hash(i):
+    return hashlib.sha256(str(i).encode()).hexdigest()
+
+
+class TestUploadedHashFilter(unittest.TestCase):
+
+    def test_membership_and_false_positive_rate(self):
+        bloom = UploadedHashFilter()
+        for i in range(10000):
+            bloom.add(_hash(i))
+        self.assertTrue(all(_hash(i) in bloom for i in range(10000)))
+
+        false_positives = sum(_hash(i) in bloom for i in range(10000, 20000))
+        self.assertLess(false_positives, 100)
+
+    def test_save_and_reload(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            bloom = load_upload_filter(Path(tmp))
+            bloom.add(_hash(1))
+            self.assertTrue(bloom.save())
+
+            reloaded = load_upload_filter(Path(tmp))
+            self.assertIn(_hash(1), reloaded)
+            self.assertNotIn(_hash(2), reloaded)
+
+
+if __name__ == '__main__':
+    unittest.main()
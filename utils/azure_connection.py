@@ -6,6 +6,7 @@ import re
 from azure.storage.blob import ContainerClient
 from azure.data.tables import TableServiceClient, TableClient
 import logging
+import threading
 
 load_dotenv()
 
@@ -20,6 +21,14 @@ storage_account_key = os.environ.get("AZURE_STORAGE_ACCOUNT_KEY")
 # Table configuration
 CIRCUITS_TABLE_NAME = "circuits"
 
+# Blob transfer tuning: circuits up to 64 MiB go up in a single Put Blob
+# request; anything larger is staged in 16 MiB blocks instead of the SDK's
+# 4 MiB defaults
+BLOB_TRANSFER_OPTIONS = {
+    "max_single_put_size": 64 * 1024 * 1024,
+    "max_block_size": 16 * 1024 * 1024,
+}
+
 logger = logging.getLogger(__name__)
 
 def table_safe(name: str) -> str:
@@ -56,18 +65,18 @@ class AzureConnection:
         # If we have a full container connection string, use it directly
         # Otherwise, build the container client using the configured container name
         if container_connection_string and container_name in container_connection_string:
-            container_client = ContainerClient.from_container_url(container_connection_string)
+            container_client = ContainerClient.from_container_url(container_connection_string, **BLOB_TRANSFER_OPTIONS)
         else:
             # Build container client from account details with configured container name
             account_url = f"https://{storage_account_name}.blob.core.windows.net"
             if storage_account_key:
                 connection_string = f"DefaultEndpointsProtocol=https;AccountName={storage_account_name};AccountKey={storage_account_key};EndpointSuffix=core.windows.net"
-                container_client = ContainerClient.from_connection_string(connection_string, container_name=container_name)
+                container_client = ContainerClient.from_connection_string(connection_string, container_name=container_name, **BLOB_TRANSFER_OPTIONS)
             else:
                 from azure.core.credentials import AzureSasCredential
                 clean_sas = sas_token.lstrip('?')
                 credential = AzureSasCredential(clean_sas)
-                container_client = ContainerClient(account_url=account_url, container_name=container_name, credential=credential)
+                container_client = ContainerClient(account_url=account_url, container_name=container_name, credential=credential, **BLOB_TRANSFER_OPTIONS)
         
         return container_client
     
@@ -146,4 +155,23 @@ class AzureConnection:
     
     def get_circuits_table_client(self) -> TableClient:
         """Get circuits table client"""
-        return self.circuits_table_client
\ No newline at end of file
+        return self.circuits_table_client
+
+_shared_connection = None
+_shared_connection_lock = threading.Lock()
+
+
+def get_azure_connection() -> AzureConnection:
+    """
+    Get the process-wide shared AzureConnection, creating it on first use.
+
+    Azure SDK clients keep their own HTTP connection pools, so reusing one
+    connection avoids repeated TLS handshakes, token fetches and table-existence
+    checks. A failed creation is not cached; the next call retries.
+    """
+    global _shared_connection
+    if _shared_connection is None:
+        with _shared_connection_lock:
+            if _shared_connection is None:
+                _shared_connection = AzureConnection()
+    return _shared_connection
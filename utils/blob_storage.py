@@ -7,20 +7,40 @@ Azure Blob Storage with multiple serialization formats.
 
 import pickle
 import logging
-from pathlib import PurePosixPath
+from pathlib import Path, PurePosixPath
 from azure.storage.blob import ContentSettings
 from io import BytesIO
 import qiskit.qpy
 
+# zstandard is optional: without it blobs are uploaded uncompressed
+try:
+    import zstandard as zstd
+    ZSTD_AVAILABLE = True
+except ImportError:
+    zstd = None
+    ZSTD_AVAILABLE = False
+
+ZSTD_LEVEL = 3
+
+# Local circuit file suffix -> (serialization method, blob content type)
+_FILE_FORMATS = {
+    ".qpy": ("qpy", "application/octet-stream"),
+    ".pkl": ("pickle", "application/octet-stream"),
+    ".qasm": ("qasm", "text/plain"),
+}
+
 # Configure logging
 logger = logging.getLogger(__name__)
 
-def upload_circuit_blob(container_client, qc, qpy_sha256: str, serialization_method: str = "qpy") -> str:
+def upload_circuit_blob(container_client, qc, qpy_sha256: str, serialization_method: str = "qpy", compress: bool = True) -> str:
     """
     Serialize QuantumCircuit qc, upload it to Azure Blob Storage,
     and return the HTTPS URL (suitable for storing in SQL).
     
     Supports multiple serialization methods with fallbacks for large circuits.
+    When zstandard is installed and compress is True, the payload is
+    zstd-compressed and tagged with metadata encoding="zstd";
+    download_circuit_blob() reverses this transparently.
     """
     logger.info(f"Uploading circuit to blob storage: {qc.num_qubits} qubits, depth {qc.depth()}, hash {qpy_sha256}")
     logger.debug(f"Requested serialization method: {serialization_method}")
@@ -68,6 +88,51 @@ def upload_circuit_blob(container_client, qc, qpy_sha256: str, serialization_met
             logger.error(f"All serialization methods failed for blob upload: {e}")
             raise ValueError("Unable to serialize circuit for upload")
     
+    metadata = {
+        "sha256": qpy_sha256,
+        "format": serialization_method,
+        "nqubits": str(qc.num_qubits),
+        "depth": str(qc.depth()),
+        "size": str(qc.size()),
+    }
+    return _upload_serialized_circuit(
+        container_client, raw_bytes, qpy_sha256, file_extension,
+        content_type, metadata, compress
+    )
+
+def upload_circuit_file_blob(container_client, circuit_path, qpy_sha256: str,
+                             num_qubits: int, depth: int, size: int, compress: bool = True) -> str:
+    """
+    Upload a circuit file written by save_circuit_locally() and return the blob URL.
+    
+    The file is uploaded as-is, so the circuit is never loaded or serialized
+    again; the blob gets the same path, metadata and compression as
+    upload_circuit_blob(). The serialization method follows the file suffix.
+    """
+    circuit_path = Path(circuit_path)
+    if circuit_path.suffix not in _FILE_FORMATS:
+        raise ValueError(f"Unsupported circuit file: {circuit_path}")
+    serialization_method, content_type = _FILE_FORMATS[circuit_path.suffix]
+    logger.info(f"Uploading circuit file to blob storage: {circuit_path.name}, hash {qpy_sha256}")
+    
+    raw_bytes = circuit_path.read_bytes()
+    metadata = {
+        "sha256": qpy_sha256,
+        "format": serialization_method,
+        "nqubits": str(num_qubits),
+        "depth": str(depth),
+        "size": str(size),
+    }
+    return _upload_serialized_circuit(
+        container_client, raw_bytes, qpy_sha256, circuit_path.suffix[1:],
+        content_type, metadata, compress
+    )
+
+def _upload_serialized_circuit(container_client, raw_bytes: bytes, qpy_sha256: str, file_extension: str,
+                               content_type: str, metadata: dict, compress: bool) -> str:
+    """Compress (if enabled) and upload already-serialized circuit bytes."""
+    serialization_method = metadata["format"]
+    
     # Create blob path
     rel_path = PurePosixPath(qpy_sha256[:2]) / f"{qpy_sha256}.{file_extension}"
     logger.debug(f"Blob path: {rel_path}")
@@ -76,22 +141,22 @@ def upload_circuit_blob(container_client, qc, qpy_sha256: str, serialization_met
     logger.debug("Uploading to Azure Blob Storage...")
     blob_client = container_client.get_blob_client(str(rel_path))
     
-    metadata = {
-        "sha256": qpy_sha256,
-        "format": serialization_method,
-        "nqubits": str(qc.num_qubits),
-        "depth": str(qc.depth()),
-        "size": str(qc.size()),
-    }
+    # The encoding is recorded in blob metadata only: a Content-Encoding
+    # header would make urllib3 decode the body itself when zstandard is installed
+    if compress and ZSTD_AVAILABLE:
+        original_size = len(raw_bytes)
+        raw_bytes = zstd.ZstdCompressor(level=ZSTD_LEVEL).compress(raw_bytes)
+        metadata["encoding"] = "zstd"
+        metadata["original_size"] = str(original_size)
+        metadata["compressed_size"] = str(len(raw_bytes))
+        logger.debug(f"✓ zstd compressed {original_size} -> {len(raw_bytes)} bytes")
     logger.debug(f"Blob metadata: {metadata}")
     
     blob_client.upload_blob(
         raw_bytes,
         overwrite=True,
-        max_concurrency=4,  # parallel blocks (>4 MiB auto-split)
-        content_settings=ContentSettings(
-            content_type=content_type
-        ),
+        max_concurrency=8,  # parallel blocks above the client's single-put size
+        content_settings=ContentSettings(content_type=content_type),
         metadata=metadata
     )
     
@@ -118,9 +183,18 @@ def download_circuit_blob(container_client, blob_path: str, serialization_method
     try:
         logger.debug("Getting blob client and downloading data...")
         blob_client = container_client.get_blob_client(blob_path)
-        blob_data = blob_client.download_blob().readall()
+        # Blobs uploaded with a Content-Encoding header must still arrive as
+        # stored bytes; decompression is driven by the metadata below
+        downloader = blob_client.download_blob(decompress=False)
+        blob_data = downloader.readall()
         logger.debug(f"✓ Downloaded {len(blob_data)} bytes from blob")
         
+        if (downloader.properties.metadata or {}).get("encoding") == "zstd":
+            if not ZSTD_AVAILABLE:
+                raise ImportError("Blob is zstd-compressed; install zstandard to read it")
+            blob_data = zstd.ZstdDecompressor().decompress(blob_data)
+            logger.debug(f"✓ zstd decompressed to {len(blob_data)} bytes")
+        
         logger.debug(f"Deserializing circuit using {serialization_method} method...")
         
         if serialization_method == "qpy":
@@ -12,6 +12,9 @@ class AsyncCheckpointWriter:
         self.buffer = []
         self.queue = queue.Queue()
         self.running = True
+        # Opened lazily by the worker thread and kept open until close(), so
+        # each batch is one buffered write instead of an open/close pair
+        self._fh = None
         self.worker_thread = threading.Thread(target=self._worker, daemon=True)
         self.worker_thread.start()
 
@@ -38,8 +41,11 @@ class AsyncCheckpointWriter:
 
     def _write_batch(self, batch):
         try:
-            with open(self.filepath, "a") as f:
-                f.write("\n".join(batch) + "\n")
+            if self._fh is None:
+                self._fh = open(self.filepath, "a", buffering=64 * 1024)
+            self._fh.write("\n".join(batch) + "\n")
+            # Hand the batch to the OS so a crashed process loses nothing
+            self._fh.flush()
         except Exception as e:
             logger.error(f"Failed to write checkpoint batch: {e}")
 
@@ -47,3 +53,6 @@ class AsyncCheckpointWriter:
         self._flush_buffer()
         self.running = False
         self.worker_thread.join()
+        if self._fh is not None:
+            self._fh.close()
+            self._fh = None
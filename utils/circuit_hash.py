@@ -22,6 +22,10 @@ from io import BytesIO
 # Configure logging
 logger = logging.getLogger(__name__)
 
+def _hash_circuit_text(circuit: QuantumCircuit) -> str:
+    """SHA-256 of the circuit's text drawing, which is what identifies a circuit."""
+    return hashlib.sha256(str(circuit).encode("utf-8")).hexdigest()
+
 def compute_circuit_hash(circuit: QuantumCircuit) -> Tuple[str, bytes, str]:
     """
     Compute SHA-256 hash of a quantum circuit with fallback methods.
@@ -71,8 +75,7 @@ def compute_circuit_hash(circuit: QuantumCircuit) -> Tuple[str, bytes, str]:
                 logger.debug(f"✓ Using metadata-based hash ({len(raw_bytes)} bytes)")
         
         # Compute SHA-256 hash
-        hash_obj = hashlib.sha256(str(circuit).encode("utf-8"))
-        hash_string = hash_obj.hexdigest()
+        hash_string = _hash_circuit_text(circuit)
         
         logger.debug(f"Circuit hash: {hash_string[:8]}... (method: {serialization_method})")
         
@@ -94,14 +97,21 @@ def compute_circuit_hash_simple(circuit: QuantumCircuit) -> str:
     This is a simplified interface that only returns the hash string.
     Use this when you only need the hash and don't care about the method used.
     
+    The hash does not depend on the serialized bytes, so the QPY dump is
+    skipped; only if hashing itself fails does this defer to
+    compute_circuit_hash() for its emergency fallback.
+    
     Args:
         circuit: The quantum circuit to hash
         
     Returns:
         SHA-256 hash as hexadecimal string
     """
-    hash_string, _, _ = compute_circuit_hash(circuit)
-    return hash_string
+    try:
+        return _hash_circuit_text(circuit)
+    except Exception:
+        hash_string, _, _ = compute_circuit_hash(circuit)
+        return hash_string
 
 def verify_circuit_hash(circuit: QuantumCircuit, expected_hash: str) -> bool:
     """
@@ -20,7 +20,7 @@ from typing import Set, Optional
 from datetime import datetime, timezone
 from qiskit import QuantumCircuit
 
-from utils.azure_connection import AzureConnection
+from utils.azure_connection import AzureConnection, get_azure_connection
 from utils.circuit_hash import compute_circuit_hash_simple
 
 # Configure logging
@@ -58,6 +58,8 @@ class DuplicateDetector:
         
         self.azure_conn: Optional[AzureConnection] = None
         self.last_sync: Optional[datetime] = None
+        # mtime of the cache file as last read or written by this instance
+        self._cache_mtime_ns: Optional[int] = None
         
         logger.info("Initializing DuplicateDetector...")
     
@@ -65,6 +67,14 @@ class DuplicateDetector:
     def known_hashes(self) -> Set[str]:
         """Get all known hashes (union of all states)."""
         return self.azure_hashes | self.pending_hashes | self.session_hashes
+    
+    def is_known(self, circuit_hash: str) -> bool:
+        """Check a hash against every state without building the union."""
+        return (
+            circuit_hash in self.azure_hashes
+            or circuit_hash in self.pending_hashes
+            or circuit_hash in self.session_hashes
+        )
         
     def initialize(self, azure_conn: Optional[AzureConnection] = None, force_refresh: bool = False) -> bool:
         """
@@ -84,7 +94,7 @@ class DuplicateDetector:
                 logger.info("✓ Using shared Azure connection for duplicate detection")
             else:
                 try:
-                    self.azure_conn = AzureConnection()
+                    self.azure_conn = get_azure_connection()
                     logger.info("✓ Azure connection established for duplicate detection")
                 except Exception as e:
                     logger.warning(f"⚠️  Azure connection failed: {e}")
@@ -127,8 +137,9 @@ class DuplicateDetector:
             circuit_hash = compute_circuit_hash_simple(circuit)
             
 
-            # Check if hash exists in any of our known sets
-            is_dup = circuit_hash in self.known_hashes
+            # Check if hash exists in any of our known sets; known_hashes would
+            # copy all of them into a new set on every check
+            is_dup = self.is_known(circuit_hash)
             
             if is_dup:
                 # Determine which set contains the hash for better logging
@@ -265,6 +276,7 @@ class DuplicateDetector:
                 logger.debug("📁 No local cache file found")
                 return False
                 
+            cache_mtime_ns = self.cache_file.stat().st_mtime_ns
             with open(self.cache_file, 'r') as f:
                 cache_data = json.load(f)
                 
@@ -281,6 +293,7 @@ class DuplicateDetector:
             self.azure_hashes = set(azure_list)
             self.pending_hashes = set(pending_list)
             self.session_hashes = set(session_list)
+            self._cache_mtime_ns = cache_mtime_ns
             
             # Load metadata - preserve last_sync from Azure
             if 'last_sync' in cache_data and cache_data['last_sync']:
@@ -332,14 +345,48 @@ class DuplicateDetector:
                 json.dump(cache_data, f, indent=2)
                 
             temp_file.rename(self.cache_file)
+            self._cache_mtime_ns = self.cache_file.stat().st_mtime_ns
             
-            logger.debug(f"💾 Saved {len(self.known_hashes)} hashes to cache")
+            logger.debug("💾 Saved %d hashes to cache", cache_data['total_count'])
             return True
             
         except Exception as e:
             logger.error(f"❌ Failed to save cache: {e}")
             return False
     
+    def refresh_from_cache(self) -> bool:
+        """
+        Merge in the hashes from the cache file if it changed since this
+        instance last read or wrote it.
+        
+        Cheap when nothing changed (one stat call), so long-lived worker
+        processes can call it per task instead of re-initializing. Hashes are
+        only ever added: every hash seen is a real circuit, so a stale one
+        just keeps it marked as known.
+        
+        Returns:
+            True if the cache file was re-read, False otherwise
+        """
+        try:
+            cache_mtime_ns = self.cache_file.stat().st_mtime_ns
+            if cache_mtime_ns == self._cache_mtime_ns:
+                return False
+            with open(self.cache_file, 'r') as f:
+                cache_data = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.debug(f"Cache refresh skipped: {e}")
+            return False
+        
+        if not isinstance(cache_data, dict):
+            return False
+        self.azure_hashes.update(cache_data.get('azure_hashes', []))
+        self.pending_hashes.update(cache_data.get('pending_hashes', []))
+        self.session_hashes.update(cache_data.get('session_hashes', []))
+        if cache_data.get('last_sync'):
+            self.last_sync = datetime.fromisoformat(cache_data['last_sync'])
+        self._cache_mtime_ns = cache_mtime_ns
+        return True
+    
     def _sync_with_azure_background(self):
         """
         Sync with Azure in background (placeholder for future async implementation).
@@ -367,6 +414,90 @@ class DuplicateDetector:
         }
 
 
+class SharedHashLog:
+    """
+    Append-only log of circuit hashes shared with worker processes.
+    
+    The manager appends the hashes each batch produced; workers read only the
+    entries added since their last read. Hashes are stored as raw 32-byte
+    SHA-256 digests in a fixed-size shared array, so publishing a hash costs
+    one copy instead of re-pickling the whole session set into every task.
+    Pass the log to workers at process creation (e.g. as an initializer
+    argument).
+    """
+    
+    DIGEST_SIZE = 32
+    
+    def __init__(self, capacity: int, mp_context=None):
+        """
+        Args:
+            capacity: Maximum number of hashes the log can hold
+            mp_context: Multiprocessing context the workers are started with
+        """
+        import multiprocessing
+        ctx = mp_context or multiprocessing.get_context()
+        self.capacity = capacity
+        self._digests = ctx.RawArray('B', capacity * self.DIGEST_SIZE)
+        # The lock orders the digest writes before the count that publishes them
+        self._count = ctx.Value('q', 0)
+    
+    def __len__(self) -> int:
+        with self._count.get_lock():
+            return self._count.value
+    
+    @property
+    def full(self) -> bool:
+        """True once no more hashes can be appended."""
+        return len(self) >= self.capacity
+    
+    def append(self, hashes) -> int:
+        """
+        Append hashes to the log (single writer: the manager process).
+        
+        Args:
+            hashes: Iterable of SHA-256 hex digests; other strings are skipped
+            
+        Returns:
+            Number of hashes appended (fewer than given once the log is full)
+        """
+        view = memoryview(self._digests).cast('B')
+        appended = 0
+        with self._count.get_lock():
+            count = self._count.value
+            for circuit_hash in hashes:
+                if count >= self.capacity:
+                    break
+                try:
+                    digest = bytes.fromhex(circuit_hash)
+                except (TypeError, ValueError):
+                    continue
+                if len(digest) != self.DIGEST_SIZE:
+                    continue
+                view[count * self.DIGEST_SIZE:(count + 1) * self.DIGEST_SIZE] = digest
+                count += 1
+                appended += 1
+            self._count.value = count
+        return appended
+    
+    def read_from(self, start: int) -> tuple[list[str], int]:
+        """
+        Read the hashes appended since position ``start``.
+        
+        Args:
+            start: Number of entries the caller has already read
+            
+        Returns:
+            Tuple of (new hashes as hex strings, position to pass next time)
+        """
+        with self._count.get_lock():
+            count = self._count.value
+        if count <= start:
+            return [], start
+        size = self.DIGEST_SIZE
+        data = bytes(memoryview(self._digests).cast('B')[start * size:count * size])
+        return [data[i:i + size].hex() for i in range(0, len(data), size)], count
+
+
 # Global instance for easy access
 _global_detector: Optional[DuplicateDetector] = None
 
@@ -0,0 +1,204 @@
+"""
+SQLite index of circuits saved to local storage.
+
+Every successful save_circuit_locally() records the circuit hash and a few
+summary fields in ``<circuits_dir>/index.sqlite``. Counting and diffing local
+storage then become indexed queries instead of walks over one directory per
+circuit. The database runs in WAL mode so parallel worker processes can insert
+concurrently while readers keep working.
+
+Circuit directories saved before the index existed are backfilled from one
+directory scan the first time the index is opened.
+"""
+
+import os
+import json
+import sqlite3
+import threading
+import time
+import logging
+from pathlib import Path
+from typing import Iterable, List, Tuple
+
+logger = logging.getLogger(__name__)
+
+INDEX_FILENAME = "index.sqlite"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS circuits (
+    hash TEXT PRIMARY KEY,
+    num_qubits INTEGER,
+    depth INTEGER,
+    size INTEGER,
+    saved_at REAL
+)
+"""
+
+# PRAGMA user_version once existing circuit directories have been indexed
+_BACKFILLED_VERSION = 1
+
+# One connection per thread and index file; sqlite3 connections must not be
+# shared across threads or inherited through fork()
+_local = threading.local()
+
+
+def index_path(out_root: Path) -> Path:
+    """Return the location of the index file for a circuits directory."""
+    return Path(out_root) / INDEX_FILENAME
+
+
+def index_exists(out_root: Path) -> bool:
+    """Check whether a circuits directory already has an index."""
+    return index_path(out_root).exists()
+
+
+def _get_connection(out_root: Path) -> sqlite3.Connection:
+    """Open (or reuse) this thread's connection to the index of ``out_root``."""
+    cache = getattr(_local, "connections", None)
+    if cache is None or getattr(_local, "pid", None) != os.getpid():
+        cache = _local.connections = {}
+        _local.pid = os.getpid()
+
+    path = str(index_path(out_root).resolve())
+    conn = cache.get(path)
+    if conn is None:
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(path, timeout=30)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(_SCHEMA)
+        conn.commit()
+        if conn.execute("PRAGMA user_version").fetchone()[0] < _BACKFILLED_VERSION:
+            _backfill(conn, Path(out_root))
+        cache[path] = conn
+    return conn
+
+
+def _backfill(conn: sqlite3.Connection, out_root: Path) -> None:
+    """
+    Index circuit directories that were saved before the index existed.
+
+    A directory counts as saved once its meta.json exists, which
+    save_circuit_locally() writes last. Runs at most once per index: the
+    write lock makes concurrent openers wait, and they find the marker set.
+    """
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        if conn.execute("PRAGMA user_version").fetchone()[0] < _BACKFILLED_VERSION:
+            rows = []
+            with os.scandir(out_root) as entries:
+                for entry in entries:
+                    if not entry.is_dir(follow_symlinks=False) or entry.name.startswith('.'):
+                        continue
+                    try:
+                        with open(os.path.join(entry.path, "meta.json")) as f:
+                            meta = json.load(f)
+                    except (OSError, ValueError):
+                        continue
+                    rows.append((
+                        entry.name,
+                        meta.get("circuit_qubits"),
+                        meta.get("circuit_depth"),
+                        meta.get("circuit_size"),
+                        entry.stat(follow_symlinks=False).st_mtime,
+                    ))
+            # Rows inserted by saves that ran meanwhile are newer; keep them
+            conn.executemany(
+                "INSERT OR IGNORE INTO circuits (hash, num_qubits, depth, size, saved_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                rows,
+            )
+            conn.execute(f"PRAGMA user_version = {_BACKFILLED_VERSION}")
+            if rows:
+                logger.info(f"📇 Indexed {len(rows)} existing circuit directories")
+        conn.commit()
+    except BaseException:
+        conn.rollback()
+        raise
+
+
+def index_insert(out_root: Path, circuit_hash: str, meta: dict) -> None:
+    """
+    Record a saved circuit in the index, replacing any previous row.
+
+    :param out_root: Circuits directory the circuit was saved under.
+    :param circuit_hash: Circuit hash (directory name).
+    :param meta: Metadata written to meta.json; circuit_qubits, circuit_depth
+                 and circuit_size are stored alongside the hash.
+    """
+    conn = _get_connection(out_root)
+    with conn:
+        conn.execute(
+            "INSERT OR REPLACE INTO circuits (hash, num_qubits, depth, size, saved_at) "
+            "VALUES (?, ?, ?, ?, ?)",
+            (
+                circuit_hash,
+                meta.get("circuit_qubits"),
+                meta.get("circuit_depth"),
+                meta.get("circuit_size"),
+                time.time(),
+            ),
+        )
+
+
+def index_remove(out_root: Path, circuit_hash: str) -> None:
+    """
+    Drop a circuit from the index after its directory was deleted.
+
+    :param out_root: Circuits directory the circuit was saved under.
+    :param circuit_hash: Circuit hash (directory name).
+    """
+    conn = _get_connection(out_root)
+    with conn:
+        conn.execute("DELETE FROM circuits WHERE hash = ?", (circuit_hash,))
+
+
+def index_count(out_root: Path) -> int:
+    """
+    Count indexed circuits.
+
+    :param out_root: Circuits directory whose index is queried.
+    :return: Number of circuits recorded in the index.
+    """
+    conn = _get_connection(out_root)
+    return conn.execute("SELECT COUNT(*) FROM circuits").fetchone()[0]
+
+
+def index_diff(
+    out_root: Path, azure_hashes: Iterable[str]
+) -> Tuple[List[str], List[str]]:
+    """
+    Compare the index against a stream of hashes stored in Azure.
+
+    The Azure hashes are inserted into a temporary table as they arrive, so the
+    iterable can be a lazy page-by-page query; both differences are then
+    computed in SQL.
+
+    :param out_root: Circuits directory whose index is queried.
+    :param azure_hashes: Hashes (RowKeys) present in Azure Table Storage.
+    :return: (hashes only stored locally, hashes only stored in Azure), sorted.
+    """
+    conn = _get_connection(out_root)
+    conn.execute("CREATE TEMP TABLE IF NOT EXISTS azure_hashes (hash TEXT PRIMARY KEY)")
+    try:
+        conn.execute("DELETE FROM azure_hashes")
+        conn.executemany(
+            "INSERT OR IGNORE INTO azure_hashes (hash) VALUES (?)",
+            ((h,) for h in azure_hashes),
+        )
+        local_only = [
+            row[0]
+            for row in conn.execute(
+                "SELECT hash FROM circuits EXCEPT SELECT hash FROM azure_hashes ORDER BY 1"
+            )
+        ]
+        azure_only = [
+            row[0]
+            for row in conn.execute(
+                "SELECT hash FROM azure_hashes EXCEPT SELECT hash FROM circuits ORDER BY 1"
+            )
+        ]
+    finally:
+        conn.execute("DROP TABLE IF EXISTS azure_hashes")
+        conn.commit()
+    return local_only, azure_only
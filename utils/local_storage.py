@@ -11,21 +11,47 @@ import logging
 import qiskit.qpy
 from io import BytesIO
 import pickle
+import sqlite3
 
 from utils.circuit_hash import compute_circuit_hash
-from typing import Dict, Any
+from utils.local_index import index_insert
+from typing import Dict, Any, Optional
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
-def save_circuit_locally(circuit, features: dict, out_root: Path, expected_hash: str = None):
+# File written inside a circuit directory for each serialization method
+CIRCUIT_FILENAMES = {
+    "qpy": "circuit.qpy",
+    "pickle": "circuit.pkl",
+    "qasm": "circuit.qasm",
+}
+
+
+def circuit_file_path(circuit_dir: Path, serialization_method: str = "qpy") -> Optional[Path]:
+    """
+    Path of the serialized circuit that save_circuit_locally() writes for a method.
+    
+    Returns None for fallback methods ("metadata", "emergency") that have no
+    loadable circuit file.
+    """
+    filename = CIRCUIT_FILENAMES.get(serialization_method)
+    return Path(circuit_dir) / filename if filename else None
+
+def save_circuit_locally(circuit, features: dict, out_root: Path, expected_hash: str = None,
+                         serialized: tuple = None):
     """
     Save a quantum circuit locally with multiple serialization fallbacks.
     
     This function attempts to save circuits using QPY format first, but falls back
     to pickle serialization for very large circuits that exceed QPY limitations.
+    Callers that already ran compute_circuit_hash() on the circuit can pass its
+    (hash, raw_bytes, serialization_method) result as ``serialized`` to skip
+    serializing the circuit again.
     """
-    logger.info(f"Starting local save for circuit: {circuit.num_qubits} qubits, depth {circuit.depth()}")
+    # depth() walks every instruction; compute it once for logging and metadata
+    circuit_depth = circuit.depth()
+    logger.info(f"Starting local save for circuit: {circuit.num_qubits} qubits, depth {circuit_depth}")
     
     # Try QPY serialization first
     qpy_success = False
@@ -36,17 +62,16 @@ def save_circuit_locally(circuit, features: dict, out_root: Path, expected_hash:
     if expected_hash:
         qpy_hash = expected_hash
         cid = qpy_hash
-        # Still need to compute for file saving, but use expected hash as ID
-        _, raw_bytes, serialization_method = compute_circuit_hash(circuit)
+        # Still need the serialized bytes for file saving, but use expected hash as ID
+        computed_hash, raw_bytes, serialization_method = serialized or compute_circuit_hash(circuit)
         qpy_success = (serialization_method == "qpy")
         
         # Log if there's a mismatch
-        computed_hash, _, _ = compute_circuit_hash(circuit)
         if computed_hash != expected_hash:
             logger.warning(f"⚠️  Circuit modified during processing: expected {expected_hash[:8]}..., computed {computed_hash[:8]}...")
     else:
         # Use centralized circuit hashing
-        qpy_hash, raw_bytes, serialization_method = compute_circuit_hash(circuit)
+        qpy_hash, raw_bytes, serialization_method = serialized or compute_circuit_hash(circuit)
         cid = qpy_hash
         qpy_success = (serialization_method == "qpy")
     dir_ = out_root / cid
@@ -63,18 +88,12 @@ def save_circuit_locally(circuit, features: dict, out_root: Path, expected_hash:
     # Save the circuit using the successful method
     logger.debug(f"Saving circuit files using {serialization_method} method...")
     if qpy_success:
-        # Save as QPY
+        # Save as QPY: raw_bytes already holds the stream qpy.dump produced
+        # while hashing, so write it as-is instead of serializing again
         qpy_path = dir_ / "circuit.qpy"
-        try:
-            with open(qpy_path, "wb") as f:
-                qiskit.qpy.dump(circuit, f)
-            logger.debug("✓ Circuit saved in QPY format")
-        except Exception as e:
-            logger.warning(f"Failed to save QPY file: {e}")
-            # Save raw bytes instead
-            with open(qpy_path, "wb") as f:
-                f.write(raw_bytes)
-            logger.debug("✓ Circuit saved as raw QPY bytes")
+        with open(qpy_path, "wb") as f:
+            f.write(raw_bytes)
+        logger.debug("✓ Circuit saved in QPY format")
     elif serialization_method == "pickle":
         # Save as pickle
         pickle_path = dir_ / "circuit.pkl"
@@ -94,7 +113,7 @@ def save_circuit_locally(circuit, features: dict, out_root: Path, expected_hash:
             info_path = dir_ / "circuit_info.txt"
             with open(info_path, "w") as f:
                 f.write(f"Qubits: {circuit.num_qubits}\n")
-                f.write(f"Depth: {circuit.depth()}\n")
+                f.write(f"Depth: {circuit_depth}\n")
                 f.write(f"Size: {circuit.size()}\n")
                 f.write(f"Serialization failed - only metadata available\n")
             logger.debug("✓ Circuit info saved as fallback")
@@ -105,7 +124,7 @@ def save_circuit_locally(circuit, features: dict, out_root: Path, expected_hash:
         "qpy_sha256": qpy_hash,
         "serialization_method": serialization_method,
         "circuit_qubits": circuit.num_qubits,
-        "circuit_depth": circuit.depth(),
+        "circuit_depth": circuit_depth,
         "circuit_size": circuit.size(),
         "qpy_serialization_success": qpy_success,
         **features,
@@ -115,6 +134,12 @@ def save_circuit_locally(circuit, features: dict, out_root: Path, expected_hash:
         json.dump(meta, f, indent=2)
     logger.debug("✓ Metadata file created")
 
+    # Keep the sqlite index in step so counts and diffs need no directory walk
+    try:
+        index_insert(out_root, cid, meta)
+    except sqlite3.Error as e:
+        logger.warning(f"Failed to update local index for {cid}: {e}")
+
     logger.info(f"✓ Circuit saved locally: {cid} (method: {serialization_method})")
     return cid, meta, True
 
@@ -13,11 +13,14 @@ Individual storage modules are organized by functionality:
 from .local_storage import (
     save_circuit_locally,
     load_circuit_locally,
-    get_circuit_info
+    get_circuit_info,
+    circuit_file_path
 )
 
 from .table_storage import (
+    BatchedMetadataWriter,
     save_circuit_metadata_to_table,
+    get_circuit_entity,
     get_circuit_metadata_from_table,
     list_circuits_from_table,
     delete_circuit_metadata_from_table
@@ -25,6 +28,7 @@ from .table_storage import (
 
 from .blob_storage import (
     upload_circuit_blob,
+    upload_circuit_file_blob,
     download_circuit_blob
 )
 
@@ -36,15 +40,19 @@ __all__ = [
     'save_circuit_locally',
     'load_circuit_locally', 
     'get_circuit_info',
+    'circuit_file_path',
     
     # Table storage
+    'BatchedMetadataWriter',
     'save_circuit_metadata_to_table',
+    'get_circuit_entity',
     'get_circuit_metadata_from_table',
     'list_circuits_from_table',
     'delete_circuit_metadata_from_table',
     
     # Blob storage
     'upload_circuit_blob',
+    'upload_circuit_file_blob',
     'download_circuit_blob',
     
     # Removed SQL storage functions - no longer using SQL database
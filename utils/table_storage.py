@@ -7,16 +7,35 @@ in Azure Table Storage.
 
 import json
 import logging
+import threading
 import numpy as np
-from azure.data.tables import TableClient
+from azure.data.tables import TableClient, TransactionOperation, UpdateMode
 from azure.core.exceptions import ResourceExistsError, ResourceNotFoundError
 from datetime import datetime, timezone
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Iterator, List, Optional
 from .azure_connection import table_safe
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Entities written before hash bucketing all live in this single partition
+LEGACY_PARTITION_KEY = "circuits"
+
+
+def circuit_partition_key(qpy_sha256: str) -> str:
+    """
+    Return the PartitionKey for a circuit: the first two hex digits of its hash.
+
+    Spreading circuits over 256 partitions lets parallel writers and
+    transactional batches target different partitions instead of one hot one.
+    """
+    return qpy_sha256[:2]
+
+
+def _candidate_partition_keys(qpy_sha256: str) -> tuple:
+    """Partitions a circuit may live in, newest layout first."""
+    return (circuit_partition_key(qpy_sha256), LEGACY_PARTITION_KEY)
+
 
 def _json_serializer(obj):
     """JSON serializer for objects not serializable by default json code"""
@@ -47,6 +66,45 @@ def _convert_numpy_types(value):
     return value
 
 
+def _build_entity(features: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Convert a features dictionary into an Azure Table entity.
+
+    Args:
+        features: Dictionary containing circuit metadata, including 'qpy_sha256'
+
+    Returns:
+        Dict[str, Any]: Entity with PartitionKey/RowKey and table-safe properties
+    """
+    entity = {
+        "PartitionKey": circuit_partition_key(features["qpy_sha256"]),  # Hash bucket
+        "RowKey": features["qpy_sha256"],  # Use hash as unique row key
+        "Timestamp": datetime.now(timezone.utc),
+    }
+
+    # Add all features to the entity, ensuring property names are table-safe
+    for key, value in features.items():
+        if key == "qpy_sha256":
+            continue  # Already used as RowKey
+
+        safe_key = table_safe(key)
+
+        # Handle different data types for Azure Tables
+        # First convert numpy types to Python native types
+        converted_value = _convert_numpy_types(value)
+
+        if isinstance(converted_value, (int, float, str, bool)):
+            entity[safe_key] = converted_value
+        elif isinstance(converted_value, (list, dict)):
+            # Convert complex types to JSON strings
+            entity[safe_key] = json.dumps(converted_value, default=_json_serializer)
+        else:
+            # Convert other types to string
+            entity[safe_key] = str(converted_value)
+
+    return entity
+
+
 def save_circuit_metadata_to_table(
     table_client: TableClient, features: Dict[str, Any]
 ) -> bool:
@@ -71,36 +129,8 @@ def save_circuit_metadata_to_table(
     try:
         # Prepare entity for Azure Tables
         logger.debug("Preparing entity for Azure Table Storage...")
-        entity = {
-            "PartitionKey": "circuits",  # Use a single partition for simplicity
-            "RowKey": circuit_hash,  # Use hash as unique row key
-            "Timestamp": datetime.now(timezone.utc),
-        }
-
-        # Add all features to the entity, ensuring property names are table-safe
-        processed_features = 0
-        for key, value in features.items():
-            if key == "qpy_sha256":
-                continue  # Already used as RowKey
-
-            safe_key = table_safe(key)
-
-            # Handle different data types for Azure Tables
-            # First convert numpy types to Python native types
-            converted_value = _convert_numpy_types(value)
-
-            if isinstance(converted_value, (int, float, str, bool)):
-                entity[safe_key] = converted_value
-            elif isinstance(converted_value, (list, dict)):
-                # Convert complex types to JSON strings
-                entity[safe_key] = json.dumps(converted_value, default=_json_serializer)
-            else:
-                # Convert other types to string
-                entity[safe_key] = str(converted_value)
-
-            processed_features += 1
-
-        logger.debug(f"✓ Processed {processed_features} features for table storage")
+        entity = _build_entity(features)
+        logger.debug(f"✓ Prepared entity with {len(entity)} properties for table storage")
 
         # Try to insert or update the entity
         logger.debug("Attempting to save entity to Azure Table...")
@@ -120,6 +150,113 @@ def save_circuit_metadata_to_table(
         return False
 
 
+class BatchedMetadataWriter:
+    """
+    Buffer circuit metadata and upsert it in Azure Table transactions.
+
+    Each transaction carries up to ``batch_size`` entities (Azure caps this
+    at 100) and must target a single partition, so entities are buffered per
+    PartitionKey. Use as a context manager, or call :meth:`flush` when done.
+    Safe to share between upload threads: buffers are swapped under a lock and
+    transactions are submitted outside it.
+    """
+
+    MAX_BATCH_SIZE = 100
+
+    def __init__(self, table_client: TableClient, batch_size: int = MAX_BATCH_SIZE):
+        self.table_client = table_client
+        self.batch_size = max(1, min(batch_size, self.MAX_BATCH_SIZE))
+        self._buffers: Dict[str, List[Dict[str, Any]]] = {}
+        self._lock = threading.Lock()
+        self.saved = 0
+        self.failed = 0
+        self.failed_hashes: List[str] = []
+
+    def add(self, features: Dict[str, Any]) -> None:
+        """
+        Queue one circuit's metadata; submits a transaction once its partition fills.
+
+        Args:
+            features: Dictionary containing circuit metadata, including 'qpy_sha256'
+        """
+        if "qpy_sha256" not in features:
+            logger.error("Missing required 'qpy_sha256' in features dictionary")
+            raise ValueError("'features' dict must contain 'qpy_sha256'")
+
+        entity = _build_entity(features)
+        partition_key = entity["PartitionKey"]
+        batch = None
+        with self._lock:
+            buffer = self._buffers.setdefault(partition_key, [])
+            buffer.append(entity)
+            if len(buffer) >= self.batch_size:
+                batch = self._buffers.pop(partition_key)
+        if batch:
+            self._submit(batch)
+
+    def flush(self) -> int:
+        """
+        Submit every buffered entity.
+
+        Returns:
+            int: Total number of entities saved by this writer so far
+        """
+        with self._lock:
+            buffers, self._buffers = self._buffers, {}
+        for entities in buffers.values():
+            for start in range(0, len(entities), self.batch_size):
+                self._submit(entities[start:start + self.batch_size])
+        return self.saved
+
+    def _submit(self, entities: List[Dict[str, Any]]) -> None:
+        """Upsert entities of a single partition in one transaction."""
+        operations = [
+            (TransactionOperation.UPSERT, entity, {"mode": UpdateMode.REPLACE})
+            for entity in entities
+        ]
+        try:
+            self.table_client.submit_transaction(operations)
+            with self._lock:
+                self.saved += len(entities)
+            logger.info(f"✓ Saved {len(entities)} circuit metadata entities in one transaction")
+            return
+        except Exception as e:
+            # Transactions are atomic: nothing in this batch was written
+            if len(entities) == 1:
+                self._record_failures(entities)
+                logger.error(f"Failed to save metadata for {entities[0]['RowKey']}: {e}")
+                return
+            logger.warning(
+                f"Metadata transaction of {len(entities)} entities failed ({e}), "
+                "retrying them one by one"
+            )
+
+        # One bad entity fails the whole transaction; upsert individually so
+        # the rest are still saved and only the culprits are reported
+        saved = 0
+        for entity in entities:
+            try:
+                self.table_client.upsert_entity(entity, mode=UpdateMode.REPLACE)
+                saved += 1
+            except Exception as e:
+                self._record_failures([entity])
+                logger.error(f"Failed to save metadata for {entity['RowKey']}: {e}")
+        with self._lock:
+            self.saved += saved
+
+    def _record_failures(self, entities: List[Dict[str, Any]]) -> None:
+        with self._lock:
+            self.failed += len(entities)
+            self.failed_hashes.extend(entity["RowKey"] for entity in entities)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.flush()
+        return False
+
+
 def update_circuit_metadata_in_table(
     table_client: TableClient, qpy_sha256: str, updates: Dict[str, Any]
 ) -> bool:
@@ -138,7 +275,7 @@ def update_circuit_metadata_in_table(
 
     try:
         entity = {
-            "PartitionKey": "circuits",
+            "PartitionKey": circuit_partition_key(qpy_sha256),
             "RowKey": qpy_sha256,
         }
 
@@ -153,7 +290,12 @@ def update_circuit_metadata_in_table(
             else:
                 entity[safe_key] = str(converted_value)
 
-        table_client.update_entity(entity, mode="merge")
+        try:
+            table_client.update_entity(entity, mode="merge")
+        except ResourceNotFoundError:
+            # Circuits saved before hash bucketing live in the legacy partition
+            entity["PartitionKey"] = LEGACY_PARTITION_KEY
+            table_client.update_entity(entity, mode="merge")
         logger.info(f"✓ Circuit metadata updated (merge) in table: {qpy_sha256}")
         return True
 
@@ -162,6 +304,28 @@ def update_circuit_metadata_in_table(
         return False
 
 
+def get_circuit_entity(table_client: TableClient, qpy_sha256: str):
+    """
+    Fetch the raw table entity for a circuit from its hash partition.
+
+    Falls back to the legacy single partition for circuits saved before
+    hash bucketing.
+
+    Args:
+        table_client: Azure Table client for the circuits table
+        qpy_sha256: Circuit hash (RowKey)
+
+    Returns:
+        TableEntity or None if the circuit is not in the table
+    """
+    for partition_key in _candidate_partition_keys(qpy_sha256):
+        try:
+            return table_client.get_entity(partition_key=partition_key, row_key=qpy_sha256)
+        except ResourceNotFoundError:
+            continue
+    return None
+
+
 def get_circuit_metadata_from_table(
     table_client: TableClient, qpy_sha256: str
 ) -> Optional[Dict[str, Any]]:
@@ -179,7 +343,9 @@ def get_circuit_metadata_from_table(
 
     try:
         logger.debug("Querying Azure Table Storage...")
-        entity = table_client.get_entity(partition_key="circuits", row_key=qpy_sha256)
+        entity = get_circuit_entity(table_client, qpy_sha256)
+        if entity is None:
+            raise ResourceNotFoundError(f"No entity for {qpy_sha256}")
         logger.debug("✓ Entity retrieved from table")
 
         # Convert entity back to regular dictionary
@@ -264,6 +430,30 @@ def list_circuits_from_table(table_client: TableClient, limit: int = 100) -> lis
         return []
 
 
+def iter_circuit_hashes(
+    table_client: TableClient, results_per_page: int = 1000
+) -> Iterator[str]:
+    """
+    Stream the hashes (RowKeys) of all circuits in Azure Table Storage.
+
+    Only RowKey is transferred and pages are fetched lazily as the caller
+    iterates, so the full table is never held in memory.
+
+    Args:
+        table_client: Azure Table client for the circuits table
+        results_per_page: Page size hint sent to the service
+
+    Yields:
+        str: Circuit hash of each entity
+    """
+    pages = table_client.list_entities(
+        select=["RowKey"], results_per_page=results_per_page
+    ).by_page()
+    for page in pages:
+        for entity in page:
+            yield entity["RowKey"]
+
+
 def delete_circuit_metadata_from_table(
     table_client: TableClient, qpy_sha256: str
 ) -> bool:
@@ -278,7 +468,10 @@ def delete_circuit_metadata_from_table(
         bool: True if successful, False otherwise
     """
     try:
-        table_client.delete_entity(partition_key="circuits", row_key=qpy_sha256)
+        entity = get_circuit_entity(table_client, qpy_sha256)
+        if entity is None:
+            raise ResourceNotFoundError(f"No entity for {qpy_sha256}")
+        table_client.delete_entity(partition_key=entity["PartitionKey"], row_key=qpy_sha256)
         logger.info(f"✓ Circuit metadata deleted from table: {qpy_sha256}")
         return True
 
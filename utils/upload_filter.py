@@ -0,0 +1,111 @@
+"""
+Bloom filter of circuit hashes already uploaded to Azure.
+
+A "written locally" circuit is not necessarily in Azure: a crash between the
+local save and the upload leaves it behind. The filter records every
+successful upload in ``<circuits_dir>/uploaded.bloom`` so an upload path can
+skip circuits that are already remote without a table probe on every miss.
+Hits may be false positives and should be confirmed against Azure Tables.
+
+Author: InferQ Pipeline System
+"""
+
+import os
+import logging
+import threading
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+UPLOAD_FILTER_FILENAME = "uploaded.bloom"
+
+
+class UploadedHashFilter:
+    """
+    Fixed-size Bloom filter keyed by SHA-256 hex digests.
+
+    The defaults (2**20 bits, 7 probes) give roughly 0.8% false positives at
+    100k circuits. Circuit hashes are already uniformly distributed, so the
+    probe positions are derived from the digest by double hashing instead of
+    rehashing the key.
+    """
+
+    def __init__(self, path: Path = None, num_bits: int = 1 << 20, num_hashes: int = 7):
+        self.path = Path(path) if path is not None else None
+        self.num_bits = num_bits
+        self.num_hashes = num_hashes
+        self._bits = bytearray((num_bits + 7) // 8)
+        self._lock = threading.Lock()
+        self._dirty = False
+
+        if self.path is not None and self.path.exists():
+            data = self.path.read_bytes()
+            if len(data) == len(self._bits):
+                self._bits[:] = data
+            else:
+                logger.warning(f"⚠️  Ignoring upload filter with unexpected size: {self.path}")
+
+    def _positions(self, circuit_hash: str):
+        h1 = int(circuit_hash[:16], 16)
+        h2 = int(circuit_hash[16:32], 16) | 1
+        return [(h1 + i * h2) % self.num_bits for i in range(self.num_hashes)]
+
+    def add(self, circuit_hash: str) -> None:
+        """Record a hash as uploaded."""
+        with self._lock:
+            for pos in self._positions(circuit_hash):
+                self._bits[pos >> 3] |= 1 << (pos & 7)
+            self._dirty = True
+
+    def __contains__(self, circuit_hash: str) -> bool:
+        return all(
+            self._bits[pos >> 3] & (1 << (pos & 7))
+            for pos in self._positions(circuit_hash)
+        )
+
+    def save(self) -> bool:
+        """
+        Persist the filter atomically if it changed since the last save.
+
+        Returns:
+            True if the file is up to date, False if writing failed
+        """
+        if self.path is None or not self._dirty:
+            return True
+        try:
+            with self._lock:
+                data = bytes(self._bits)
+                self._dirty = False
+            tmp_path = self.path.with_suffix(".tmp")
+            tmp_path.write_bytes(data)
+            os.replace(tmp_path, self.path)
+            return True
+        except OSError as e:
+            self._dirty = True
+            logger.warning(f"⚠️  Failed to save upload filter: {e}")
+            return False
+
+
+def load_upload_filter(circuits_dir: Path) -> UploadedHashFilter:
+    """Open the upload filter stored alongside the local circuits."""
+    return UploadedHashFilter(Path(circuits_dir) / UPLOAD_FILTER_FILENAME)
+
+
+_shared_filter = None
+_shared_filter_lock = threading.Lock()
+
+
+def get_upload_filter() -> UploadedHashFilter:
+    """
+    Get the process-wide upload filter for the configured circuits directory.
+
+    Upload threads share one instance; call ``save()`` on it before exit.
+    """
+    global _shared_filter
+    if _shared_filter is None:
+        with _shared_filter_lock:
+            if _shared_filter is None:
+                from config import get_storage_config
+                storage_config = get_storage_config()
+                _shared_filter = load_upload_filter(storage_config['local_circuits_dir'])
+    return _shared_filter